@@ -2,10 +2,17 @@
 """
 
 from __future__ import annotations
+import os
+import re
+from array import array
+from collections import deque
+from functools import lru_cache
+from hashlib import sha256
+from lxml import etree
 from sys import stderr
-from bs4 import BeautifulSoup
-from queue import SimpleQueue
-from typing import TextIO
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+from selectolax.lexbor import LexborHTMLParser
+from typing import BinaryIO, Callable, Hashable, Iterator
 from spider.spider_models import *
 
 __author__ = "Boaty McBoatface, Planey McPlaneface"
@@ -14,74 +21,346 @@ __credits__ = ["Boaty McBoatface", "Planey McPlaneface", "Mike Ryu"]
 __license__ = "MIT"
 __email__ = "mryu@westmont.edu"
 
+FP_DIGEST_SIZE = 8  # Size of the document fingerprint in bytes, taken from the digest (i.e., a 64-bit fingerprint).
+COMPACT_DB_INITIAL_CAPACITY = 1 << 10  # Initial number of slots of an `OrbCompactDocDB` (must be a power of 2).
+COMPACT_DB_MAX_LOAD = 0.75  # Load factor at which an `OrbCompactDocDB` doubles its capacity.
+
 
 class OrbDocFP(SpiderDocFP):
-    """TODO: Implement this class and complete the class docstring."""
-    pass
+    """Document fingerprint for `OrbDoc`'s; the fingerprint value is the first 64 bits of the SHA-256 digest of
+    the document content.
+
+    Notes:
+        Unlike the built-in `hash` of a `str`, which is salted per interpreter process, the digest of the same
+        content is always the same value -- even across processes and runs of the crawler.
+
+        The SHA-256 digest is simply truncated to `FP_DIGEST_SIZE` bytes to serve as a 64-bit fingerprint; any
+        well-mixed digest would do, as the fingerprint is not meant to be cryptographically secure.
+
+        Two `OrbDocFP`'s are considered equal if they have the same fingerprint value (`_fp`).
+
+    Attributes:
+        _fp (int): fingerprint value computed from the UTF-8 encoded document content upon instantiation.
+
+    """
+    __slots__ = ("_fp",)
+
+    def __init__(self, content: str) -> None:
+        self._fp: int = int.from_bytes(sha256(content.encode("utf-8")).digest()[:FP_DIGEST_SIZE], "big")
+
+    def __hash__(self) -> int:
+        return self._fp
+
+    def __eq__(self, other) -> bool:
+        if other is None or not isinstance(other, OrbDocFP):
+            return False
+        else:
+            return self._fp == other._fp
+
+    def __str__(self) -> str:
+        return str(self._fp)
 
 
 class OrbDoc(SpiderDoc):
-    """TODO: Implement this class and complete the class docstring."""
-    pass
+    """Plain text document yielded by `OrbContentProcessor` from the content of a local HTML page.
+
+    The fingerprint of an `OrbDoc` is an `OrbDocFP` computed lazily from `_content`.
+
+    """
+    __slots__ = ()
+
+    def _compute_fingerprint(self) -> None:
+        self._fingerprint = OrbDocFP(self._content)
 
 
 class OrbURI(SpiderURI):
-    """TODO: Implement this class and complete the class docstring."""
-    pass
+    """URI for a local HTML page (or an external web page, which `OrbAgent` does not fetch).
+
+    Notes:
+        The hash of an `OrbURI` is the hash of its `_uri` string, consistent with `SpiderURI.__eq__`; it is
+        computed once by `SpiderURI.__init__` so `OrbUriDB` probes do not rehash the string every time.
+
+    """
+    __slots__ = ()
+
+    def __hash__(self) -> int:
+        return self._hash
+
 
 class OrbContentProcessor(SpiderContentProcessor):
-    """TODO: Implement this class and complete the class docstring.
+    """Content processor that lazily yields `OrbDoc`'s parsed by an `OrbAgent`, skipping any `OrbDoc` whose
+    fingerprint has already been stored in the agent's `SpiderDocDB`.
+
+    Notes:
+        Whether a document has been seen is evaluated on each invocation `__next__`; the fingerprint of the
+        `OrbDoc` about to be returned is added to the database at that time.
 
-    HINT:
-        Lazily evaluate whether the content has been seen by checking if the document `__next__` method is about
-        to return has its fingerprint already stored in `self._agent.doc_db`; skip any document that has its
-        fingerprint already stored in the database, but add any new document's fingerprint to the database.
+    Attributes:
+        _docs (Iterator[OrbDoc]): candidate `OrbDoc`'s yet to be checked against the database.
 
     """
-    pass
+    __slots__ = ("_docs",)
+
+    def __init__(self, agent: SpiderAgent, docs: list[OrbDoc]) -> None:
+        super().__init__(agent)
+        self._docs: Iterator[OrbDoc] = iter(docs)
+
+    def __next__(self) -> OrbDoc:
+        for doc in self._docs:
+            if self._doc_db.add(doc.fingerprint):
+                return doc
+        raise StopIteration
 
 
 class OrbLinkProcessor(SpiderLinkProcessor):
-    """TODO: Implement this class and complete the class docstring.
+    """Link processor that lazily yields `OrbURI`'s for the hyperlinks extracted by an `OrbAgent`, skipping
+    any `OrbURI` that has already been stored in the agent's `SpiderUriDB`.
 
-    HINT:
-        Do the similar lazy evaluation as `OrbContentProcessor`, except for the URIs using `self._agent.uri_db`.
+    Notes:
+        Links that are not external are normalized relative to the directory of the parent page's URI, so that
+        they can be opened as local file paths by subsequent `OrbAgent`'s. Each `OrbURI` is instantiated with
+        its `props` attribute set as: {"parent": self._agent.uri.uri}
 
-        Your implementation must include instantiating `OrbURI`'s with its `props` attribute set as:
-            {"parent": self._agent.uri.uri}
+    Attributes:
+        _links (Iterator[str]): raw link texts (e.g., `href` attribute values) yet to be processed.
+        _parent (str): URI string of the page the links were extracted from (i.e., `self._agent.uri.uri`).
+        _search_external (Callable): bound `search` of the agent's `external_pattern`, hoisted out of the link loop.
 
     """
-    pass
+    __slots__ = ("_links", "_parent", "_search_external")
+
+    def __init__(self, agent: OrbAgent, links: list[str]) -> None:
+        super().__init__(agent)
+        self._links: Iterator[str] = iter(links)
+        self._parent: str = agent.uri.uri
+        self._search_external: Callable[[str], re.Match | None] = agent.external_pattern.search
+
+    def __next__(self) -> OrbURI:
+        parent = self._parent
+        for link in self._links:
+            uri = OrbURI(self._normalize_link(parent, link), {"parent": parent})
+            if self._uri_db.add(uri):
+                return uri
+        raise StopIteration
+
+    def _normalize_link(self, parent: str, link: str) -> str:
+        """Returns the external `link` as-is, or the local `link` resolved against the `parent` page's directory."""
+        if self._search_external(link) is not None:
+            return link
+        else:
+            return os.path.normpath(os.path.join(os.path.dirname(parent), link))
 
     @staticmethod
-    def is_link_external(agent: SpiderAgent, link: str) -> bool:
+    def is_link_external(agent: OrbAgent, link: str) -> bool:
         """Determines if the given link is an external (web) link based on the definition of "external" tokens
         provided by the `agent`'s configuration (`agent.config`).
 
+        Notes:
+            Rather than scanning the link once per token, the link is searched once with the alternation of
+            all "external" tokens, which is compiled only once per configuration (`OrbAgent.external_pattern`).
+
         Args:
-            agent (SpiderAgent): a `SpiderAgent` to provide the configuration for the "external" tokens.
+            agent (OrbAgent): an `OrbAgent` to provide the configuration for the "external" tokens.
             link (str): actual link text to check.
 
         Returns:
             `True` if the link is determined to be an external link, `False` otherwise.
         """
-        link_text_to_treat_as_external = agent.config["external"]
-        is_external = False
+        return agent.external_pattern.search(link) is not None
 
-        for txt in link_text_to_treat_as_external:
-            if txt in link:
-                is_external |= True
 
-        return is_external
+class OrbAgent(SpiderAgent):
+    """Crawler agent that opens a local HTML page as a file and parses it using `BeautifulSoup`.
 
+    Notes:
+        `OrbAgent` expects the following keys in its `_config`:
+            "external" (list[str]): tokens that mark a link as external (e.g., "https://").
+            "encoding" (str): encoding of the local HTML files, passed on to the parser to decode the raw bytes.
+            "parser" (str): "lexbor" (or "selectolax"), "iterparse", or a `BeautifulSoup` parser name (e.g., "lxml").
+            "tags" (dict): HTML tag names to extract content from, mapped to attributes to filter the tags by.
+            "debug" (bool): whether to report file operation errors to `stderr`.
+
+    """
+    __slots__ = ()
+
+    @property
+    def external_pattern(self) -> re.Pattern:
+        return OrbAgent._external_pattern_for(tuple(self._config["external"]))
 
-class OrbAgent(SpiderAgent):
-    """TODO: Implement this class and complete the class docstring."""
     def crawl(self) -> (OrbContentProcessor, OrbLinkProcessor):
-        pass  # HINT: use `BeautifulSoup` in this method implementation.
+        """Parses the local HTML page at `self._uri` into at most one `OrbDoc` and a list of hyperlinks.
+
+        The content of the `OrbDoc` is the text directly contained in each tag configured in
+        `self._config["tags"]`, joined by a single space in the order the tags are configured; tags that contain no
+        text (other than whitespace) are skipped rather than adding a separator of their own.
+        If `self._config["parser"]` is "lexbor" (or "selectolax"), the page is parsed by `selectolax`'s Lexbor backend;
+        if it is "iterparse", the page is stream-parsed by `lxml.etree.iterparse`;
+        otherwise, the parser name is passed on to `BeautifulSoup`.
+        If the page cannot be opened (or is an external link), both processors will yield nothing.
+
+        Yields:
+            A tuple of size 2 containing `OrbContentProcessor`, `OrbLinkProcessor`, respectively.
+
+        """
+        docs, links = [], []
+        file_obj = self._open_uri_as_file()
+
+        if file_obj:
+            with file_obj:
+                parser = self._config["parser"]
+                if parser == "lexbor" or parser == "selectolax":
+                    texts, links = self._parse_with_selectolax(file_obj)
+                elif parser == "iterparse":
+                    texts, links = self._parse_with_iterparse(file_obj)
+                else:
+                    texts, links = self._parse_with_bs4(file_obj)
+
+            content = " ".join(s for s in (text.strip().replace("\n", " ") for text in texts) if s)
+            if content:
+                docs.append(OrbDoc(content))
+
+        return OrbContentProcessor(self, docs), OrbLinkProcessor(self, links)
+
+    def _parse_with_bs4(self, file_obj: BinaryIO) -> (list[str], list[str]):
+        """Parses the page using `BeautifulSoup`, building only the configured tags and anchors into the tree.
+
+        Only plain `NavigableString` children make up the text of a tag; its comments (and any other subclass of
+        `NavigableString`, e.g., `CData`) are left out, just like the other parsers do.
+
+        Returns:
+            A tuple of size 2 containing the texts of the configured tags and the `href`'s of the anchors.
+
+        """
+        tags = self._config["tags"]
+        strainer = OrbAgent._strainer_for(tuple(tags))
+        soup = BeautifulSoup(file_obj, self._config["parser"], parse_only=strainer,
+                             from_encoding=self._config["encoding"])
+
+        texts = ["".join(child for child in tag.children if type(child) is NavigableString)
+                 for name, attrs in tags.items() for tag in soup.find_all(name, attrs)]
+        links = [anchor["href"] for anchor in soup.find_all("a", href=True)]
+        return texts, links
+
+    def _parse_with_selectolax(self, file_obj: BinaryIO) -> (list[str], list[str]):
+        """Parses the page using `selectolax`'s `LexborHTMLParser`, bypassing `BeautifulSoup`'s Python-level tree.
+
+        Bytes that are invalid in the configured encoding are replaced by U+FFFD (just like the `lxml` parsers do)
+        instead of failing the crawl.
+
+        Returns:
+            A tuple of size 2 containing the texts of the configured tags and the `href`'s of the anchors.
+
+        """
+        tree = LexborHTMLParser(file_obj.read().decode(self._config["encoding"], errors="replace"))
 
-    def _open_uri_as_file(self) -> TextIO | None:
-        """If `self._uri.uri` is not an external link, opens the file specified by the URI and returns it.
+        texts = [node.text(deep=False)
+                 for name, attrs in self._config["tags"].items()
+                 for node in tree.css(OrbAgent._to_css_selector(name, attrs))]
+        links = [anchor.attributes["href"] or "" for anchor in tree.css("a[href]")]  # `None` for a valueless `href`.
+        return texts, links
+
+    def _parse_with_iterparse(self, file_obj: BinaryIO) -> (list[str], list[str]):
+        """Stream-parses the page using `lxml.etree.iterparse`, clearing each element as soon as its end tag
+        has been parsed and detaching it from its parent, so that the full tree of the page is never held in memory.
+
+        Notes:
+            The tail text of each element is kept when it is cleared, since it is part of the text directly
+            contained in the parent element. For the same reason, the (cleared) children of a configured tag are
+            only discarded when the configured tag itself ends; apart from those, only the ancestors of the element
+            being parsed remain in the tree.
+
+            The texts are grouped by tag in the order the tags are configured, consistent with the other parsers.
+
+        Returns:
+            A tuple of size 2 containing the texts of the configured tags and the `href`'s of the anchors.
+
+        """
+        tags = self._config["tags"]
+        texts_by_tag = {name: [] for name in tags}
+        links = []
+
+        try:
+            for _, elem in etree.iterparse(file_obj, events=("end",), html=True, encoding=self._config["encoding"]):
+                tag = elem.tag
+                if tag in tags and OrbAgent._has_attrs(elem, tags[tag]):
+                    texts_by_tag[tag].append((elem.text or "") + "".join(child.tail or "" for child in elem))
+                if tag == "a" and elem.get("href") is not None:
+                    links.append(elem.get("href"))
+                elem.clear(keep_tail=True)
+
+                parent = elem.getparent()
+                if parent is not None and parent.tag not in tags:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+        except etree.XMLSyntaxError:
+            pass  # Raised by `iterparse` when the page does not contain any element at all.
+
+        return [text for texts in texts_by_tag.values() for text in texts], links
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _strainer_for(names: tuple[str, ...]) -> SoupStrainer:
+        """Returns the `SoupStrainer` that lets only the tags `names` and anchors into the tree; it is built once per
+        distinct tuple of tag names and then shared by every `OrbAgent` (and every crawl) configured with them."""
+        return SoupStrainer(list(names) + ["a"])
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _external_pattern_for(tokens: tuple[str, ...]) -> re.Pattern:
+        """Returns the pattern matching any one of the "external" `tokens` (or nothing, if there are none); it is
+        compiled once per distinct tuple of tokens and then shared by every `OrbAgent` configured with them."""
+        return re.compile("|".join(map(re.escape, tokens)) if tokens else r"(?!)")
+
+    @staticmethod
+    def _has_attrs(elem: etree.ElementBase, attrs: dict) -> bool:
+        """Checks the `lxml` element against the attribute filters configured for its tag, the same way that
+        `BeautifulSoup.find_all` does; a list of attribute values matches any one of the values, and `True` matches
+        any value at all (i.e., the attribute only has to be present)."""
+        for key, values in attrs.items():
+            actual = elem.get(key)
+            if actual is None:
+                return False
+            if values is True:
+                continue
+
+            actual = actual.split() if key == "class" else [actual]
+            values = values if isinstance(values, list) else [values]
+            if not any(value in actual for value in values):
+                return False
+        return True
+
+    @staticmethod
+    def _to_css_selector(name: str, attrs: dict) -> str:
+        """Converts a tag name and its attribute filters (as configured for `BeautifulSoup.find_all`) to a
+        CSS selector; a list of attribute values matches any one of the values, and `True` matches any value at all
+        (i.e., the attribute only has to be present), just like in `BeautifulSoup`.
+
+        Example:
+            >>> OrbAgent._to_css_selector("div", {"class": ["p", "q"], "id": True})
+            'div[class~="p"][id], div[class~="q"][id]'
+        """
+        selectors = [name]
+        for key, values in attrs.items():
+            if values is True:
+                selectors = [f"{selector}[{key}]" for selector in selectors]
+                continue
+
+            operator = "~=" if key == "class" else "="
+            values = values if isinstance(values, list) else [values]
+            selectors = [f"{selector}[{key}{operator}{OrbAgent._to_css_string(value)}]"
+                         for selector in selectors for value in values]
+        return ", ".join(selectors)
+
+    @staticmethod
+    def _to_css_string(value: str) -> str:
+        """Quotes the attribute `value` as a CSS string, escaping the characters that would otherwise end the string
+        early or be read as an escape (`"`, `\\`, and line breaks)."""
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\a ")
+        return f'"{escaped}"'
+
+    def _open_uri_as_file(self) -> BinaryIO | None:
+        """If `self._uri.uri` is not an external link, opens the file specified by the URI in binary mode and
+        returns it; decoding the bytes is left to the parser, so the page is not decoded into `str` beforehand.
 
         In case of a file operation error, this method simply returns `None` instead of raising an exception.
         If `_config` has a "debug" flag where it is set to `True`, the file operation error will be reported
@@ -93,7 +372,7 @@ class OrbAgent(SpiderAgent):
         """
         try:
             if not OrbLinkProcessor.is_link_external(self, self._uri.uri):
-                return open(self._uri.uri, 'r', encoding=self._config["encoding"])
+                return open(self._uri.uri, 'rb')
         except OSError as e:
             if self._config["debug"]:
                 err_str = "Link from ...{} failed to open:\n".format(
@@ -104,43 +383,205 @@ class OrbAgent(SpiderAgent):
 
 
 class OrbUriFrontier(SpiderUriFrontier):
-    """URI Frontier implementation that utilizes Python's built-in `SimpleQueue`; `OrbUriFrontier` is a simple
+    """URI Frontier implementation that utilizes Python's built-in `deque`; `OrbUriFrontier` is a simple
     sequential FIFO queue that does not perform any prioritization or politeness enforcement.
 
     Notes:
-        `SimpleQueue` does not support "peeking" due to thread-safety issues (which we are not concerned with).
-        Therefore, we must manually manage the very front of the queue separately from to the rest of the queue
-        backed by `SimpleQueue` in order to implement `peek`. In other words, `OrbUriFrontier`'s operations are
-        actually backed by `SimpleQueue` plus a singular reference (`_next`) to the element at the very front of the
-        queue -- which, when populated, is the element to be returned on the "next" call to `pop` or `peek`.
+        The crawl is sequential, so the locking done by a thread-safe queue (e.g., `SimpleQueue`) is unnecessary.
+        `deque` supports O(1) additions and removals at both ends as well as indexing of the very front of the
+        queue, which is all that `push`, `pop`, and `peek` require.
 
     Attributes:
-        _q (SimpleQueue): actual queue that backs the operations of this URI Frontier.
-        _next (OrbURI | None): `OrbURI` to be returned on the next call to `pop` or `peek`.
+        _q (deque[OrbURI]): actual queue that backs the operations of this URI Frontier.
 
     """
-    def __init__(self, seeds: list[OrbURI]) -> None:  # DO NOT MODIFY THIS CONSTRUCTOR!
-        self._q: SimpleQueue = SimpleQueue()
-        self._next: OrbURI | None = None
+    __slots__ = ("_q",)
+
+    def __init__(self, seeds: list[OrbURI]) -> None:
+        self._q: deque[OrbURI] = deque()
         super().__init__(seeds)
 
-    def __len__(self):  # DO NOT MODIFY THIS DEFINITION!
-        return self._q.qsize() + 1 if self._next else 0
+    def __bool__(self) -> bool:
+        return bool(self._q)
 
-    def __str__(self):  # DO NOT MODIFY THIS DEFINITION!
-        return "Size: {:d}\nNext: {}".format(self.__len__(), self._next)
+    def __len__(self) -> int:
+        return len(self._q)
+
+    def __str__(self) -> str:
+        return "Size: {:d}\nNext: {}".format(len(self._q), self._q[0] if self._q else None)
+
+    def push(self, uri: OrbURI) -> None:
+        self._q.append(uri)
+
+    def push_all(self, *args: OrbURI) -> None:
+        """Adds all `OrbURI`'s passed in via `args` to the back of the queue at once, in the order given."""
+        self._q.extend(args)
+
+    def peek(self) -> OrbURI:
+        return self._q[0]
+
+    def pop(self) -> OrbURI:
+        return self._q.popleft()
 
 
 class OrbDB(SpiderDB):
-    """TODO: Implement this class and complete the class docstring."""
-    pass
+    """Database of `SpiderArtifact`'s backed by Python's built-in `set` of the keys returned by `_key`; relies on
+    the `__hash__` and `__eq__` of the keys for constant time membership checks, additions, and removals.
+
+    Notes:
+        By default, the key of a `SpiderArtifact` is the `SpiderArtifact` itself, so two `SpiderArtifact`'s with
+        the same hash value are still told apart by their `__eq__`.
+
+    Attributes:
+        _keys (set): actual set of keys that backs the operations of this database.
+
+    """
+    __slots__ = ("_keys",)
+
+    def __init__(self) -> None:
+        self._keys: set = set()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, item: SpiderArtifact) -> bool:
+        return self._key(item) in self._keys
+
+    def add(self, item: SpiderArtifact) -> bool:
+        key = self._key(item)
+        if key in self._keys:
+            return False
+        else:
+            self._keys.add(key)
+            return True
+
+    def remove(self, item: SpiderArtifact) -> bool:
+        key = self._key(item)
+        if key in self._keys:
+            self._keys.remove(key)
+            return True
+        else:
+            return False
+
+    @staticmethod
+    def _key(item: SpiderArtifact) -> Hashable:
+        """Returns the value that represents `item` in `_keys`; the `item` itself, unless overridden."""
+        return item
 
 
 class OrbDocDB(OrbDB, SpiderDocDB):
-    """TODO: Depending on your implementation of OrbDB, this definition may not be needed."""
-    pass
+    """`OrbDB` that stores the fingerprint values (`_fp`) of the `OrbDocFP`'s of the `OrbDoc`'s seen by the
+    crawling system as plain `int`'s, rather than the `OrbDocFP` objects themselves.
+
+    Notes:
+        Two `OrbDocFP`'s are equal exactly when their 64-bit `_fp`'s are, so storing the `_fp`'s is equivalent to
+        storing the `OrbDocFP`'s (unlike storing `hash(fp)`, which Python reduces modulo 2**61 - 1 whenever `_fp`
+        does not fit in a signed 64-bit integer).
+
+    """
+    __slots__ = ()
+
+    @staticmethod
+    def _key(item: OrbDocFP) -> int:
+        return item._fp
 
 
 class OrbUriDB(OrbDB, SpiderUriDB):
-    """TODO: Depending on your implementation of OrbDB, this definition may not be needed."""
-    pass
+    """`OrbDB` that stores the `OrbURI`'s seen by the crawling system."""
+    __slots__ = ()
+
+
+class OrbCompactDocDB(SpiderDocDB):
+    """`SpiderDocDB` that stores the fingerprint values (`_fp`) of the `OrbDocFP`'s in an open-addressing hash table
+    backed by a flat `array` of unsigned 64-bit integers (8 bytes per slot, as opposed to ~100 bytes per entry of a
+    `set`).
+
+    Notes:
+        Collisions are resolved by linear probing, and removals use backward-shift deletion so that no tombstones
+        are needed. The value 0 marks an empty slot, so a fingerprint of 0 is stored as 1 instead; that is, like in
+        `OrbDocDB`, two `OrbDocFP`'s with the same fingerprint value are considered the same (and so are the
+        fingerprints 0 and 1).
+
+        The table doubles its capacity once more than `COMPACT_DB_MAX_LOAD` of its slots are occupied. Probing is
+        done in Python, so each operation is slower than that of `OrbDocDB`; this database trades some speed for
+        a much smaller memory footprint on very large crawls.
+
+    Attributes:
+        _table (array): slots of the hash table, each either 0 (empty) or a stored fingerprint value.
+        _mask (int): capacity of `_table` minus one, used to map fingerprint values to slot indices.
+        _size (int): number of fingerprint values currently stored in `_table`.
+
+    """
+    __slots__ = ("_table", "_mask", "_size")
+
+    def __init__(self, capacity: int = COMPACT_DB_INITIAL_CAPACITY) -> None:
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("Capacity of OrbCompactDocDB must be a positive power of 2.")
+        self._table: array = array("Q", bytes(8 * capacity))
+        self._mask: int = capacity - 1
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, item: SpiderArtifact) -> bool:
+        return self._table[self._find(OrbCompactDocDB._key(item))] != 0
+
+    def add(self, item: SpiderArtifact) -> bool:
+        key = OrbCompactDocDB._key(item)
+        i = self._find(key)
+        if self._table[i]:
+            return False
+
+        self._table[i] = key
+        self._size += 1
+        if self._size > COMPACT_DB_MAX_LOAD * (self._mask + 1):
+            self._resize(2 * (self._mask + 1))
+        return True
+
+    def remove(self, item: SpiderArtifact) -> bool:
+        table, mask = self._table, self._mask
+        i = self._find(OrbCompactDocDB._key(item))
+        if not table[i]:
+            return False
+
+        j = i
+        while True:
+            j = (j + 1) & mask
+            key = table[j]
+            if not key:
+                break
+            home = key & mask
+            if (j - home) & mask >= (j - i) & mask:
+                table[i] = key
+                i = j
+        table[i] = 0
+        self._size -= 1
+        return True
+
+    def _find(self, key: int) -> int:
+        """Returns the index of the slot holding `key`, or of the empty slot where `key` would be stored."""
+        table, mask = self._table, self._mask
+        i = key & mask
+        slot = table[i]
+        while slot and slot != key:
+            i = (i + 1) & mask
+            slot = table[i]
+        return i
+
+    def _resize(self, capacity: int) -> None:
+        """Rebuilds `_table` with the given `capacity`, reinserting every stored fingerprint value."""
+        old_table = self._table
+        self._table = table = array("Q", bytes(8 * capacity))
+        self._mask = mask = capacity - 1
+        for key in old_table:
+            if key:
+                i = key & mask
+                while table[i]:
+                    i = (i + 1) & mask
+                table[i] = key
+
+    @staticmethod
+    def _key(item: OrbDocFP) -> int:
+        """Returns the 64-bit fingerprint of `item` as the value to store, using 1 in place of 0 (the empty slot)."""
+        return item._fp or 1
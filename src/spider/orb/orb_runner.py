@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
-"""Runs local sequential crawl using `spider.orb` package based on the configuration provided.
+"""Runs local sequential (or concurrent) crawl using `spider.orb` package based on the configuration provided.
 """
 
-import io
+import os
 import sys
 import json
+import asyncio
 import argparse
-from spider.orb.orb_models import OrbURI, OrbDoc, OrbUriFrontier, OrbDocDB, OrbUriDB, OrbAgent
-from text_processing.freq_utils import tokenize_file, print_frequencies
-from text_processing.freq_counter import compute_twogram_freq
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from spider.orb.orb_models import OrbURI, OrbDoc, OrbUriFrontier, OrbDocDB, OrbCompactDocDB, OrbUriDB, OrbAgent
+from text_processing.freq_utils import tokenize_string, print_frequencies
+from text_processing.freq_counter import compute_twogram_freq_stream
 from nltk.corpus import stopwords
 
 __author__ = "Boaty McBoatface, Planey McPlaneface"
@@ -26,12 +29,27 @@ VALID_CONFIG_SCHEMA = {
   "agent_config": {
     "external": [],
     "encoding": "",
-    "parser": "",
+    "parser": "lxml",
     "tags": {},
     "debug": False
   }
 }
 
+_MISSING = object()  # Sentinel for a key path not present in the config.
+
+
+def _flatten_schema(schema, prefix=()):
+    """Returns a tuple of every key path in the `schema` (nested dictionaries included) as a tuple of keys."""
+    key_paths = []
+    for key, value in schema.items():
+        key_paths.append(prefix + (key,))
+        if isinstance(value, dict):
+            key_paths.extend(_flatten_schema(value, prefix + (key,)))
+    return tuple(key_paths)
+
+
+VALID_CONFIG_KEY_PATHS = _flatten_schema(VALID_CONFIG_SCHEMA)
+
 
 def main() -> None:
     pars = setup_argument_parser()
@@ -39,16 +57,26 @@ def main() -> None:
 
     try:
         config = json.loads(open(args.config_file_path, 'r').read())
-        if not validate_config(config, VALID_CONFIG_SCHEMA):
+        if not validate_config(config):
             raise OSError(f"Invalid configuration file: {args.config_file_path}")
     except OSError as e:
         print("An error occurred while trying to open files:\n  ", e, file=sys.stderr)
         exit(1)
 
-    doc_stream = io.StringIO()
+    if not config["agent_config"]["debug"]:
+        global debug_print_current_uri, debug_print_current_doc
+        debug_print_current_uri = debug_print_current_doc = _debug_print_nothing
+
     uri_frontier = OrbUriFrontier(list(map(OrbURI, config["seeds"])))
-    run_sequential_crawl(doc_stream, uri_frontier, OrbDocDB(), OrbUriDB(), config)
-    print_twogram_freq(remove_stopwords(tokenize_file(doc_stream), config), args.output_file_path, config)
+    doc_db = OrbCompactDocDB() if args.compact_doc_db else OrbDocDB()
+    if args.workers > 1:
+        docs = run_parallel_crawl(uri_frontier, doc_db, OrbUriDB(), config, args.workers)
+    elif args.async_pages > 1:
+        docs = run_async_crawl(uri_frontier, doc_db, OrbUriDB(), config, args.async_pages)
+    else:
+        docs = run_sequential_crawl(uri_frontier, doc_db, OrbUriDB(), config)
+    all_words = (word for doc in docs for word in tokenize_string(doc.content))
+    print_twogram_freq(remove_stopwords(all_words, config), args.output_file_path, config)
 
 
 def setup_argument_parser() -> argparse.ArgumentParser:
@@ -57,48 +85,255 @@ def setup_argument_parser() -> argparse.ArgumentParser:
                       help="required string containing the path to a config JSON file")
     pars.add_argument("output_file_path", type=str, nargs='?',
                       help="optional string containing the path to an output text file")
+    concurrency = pars.add_mutually_exclusive_group()
+    concurrency.add_argument("-w", "--workers", type=int, nargs='?', const=os.cpu_count(), default=1,
+                             help="number of processes to parse pages with in parallel "
+                                  "(all CPU cores if no number is given)")
+    concurrency.add_argument("-a", "--async-pages", type=int, nargs='?', const=64, default=1,
+                             help="number of pages to open and parse concurrently with asyncio "
+                                  "(64 if no number is given)")
+    pars.add_argument("-c", "--compact-doc-db", action="store_true",
+                      help="store document fingerprints in a compact array-backed hash table to save memory")
     return pars
 
 
-def validate_config(config, schema, sub=""):
-    is_valid = True
+def validate_config(config, key_paths=VALID_CONFIG_KEY_PATHS):
+    """Checks that every key path (of `VALID_CONFIG_SCHEMA` by default) is present in the `config` dictionary given.
+
+    The missing keys are collected first and reported to `stderr` with a single write, each as a dotted key path
+    (e.g., "agent_config.parser").
+
+    Args:
+        config (dict): configuration loaded from the config JSON file.
+        key_paths (tuple): key paths to check, each as a tuple of keys; defaults to `VALID_CONFIG_KEY_PATHS`.
+
+    Returns:
+        `True` if all key paths are present in `config`, `False` otherwise.
+    """
+    errors = [f"Required key [{'.'.join(path)}] is not present in the config file provided."
+              for path in key_paths if _get_by_path(config, path) is _MISSING]
+
+    if errors:
+        sys.stderr.write("\n".join(errors) + "\n")
+
+    return not errors
+
 
-    for key in schema.keys():
-        config_exists = key in config.keys()
-        is_valid &= config_exists
+def _get_by_path(config, path):
+    """Returns the value in the nested `config` dictionary at the key `path`, or `_MISSING` if there is none."""
+    node = config
+    for key in path:
+        if not isinstance(node, dict) or key not in node:
+            return _MISSING
+        node = node[key]
+    return node
 
-        if not config_exists:
-            print(f"Required {sub}key [{key}] is not present in the config file provided.", file=sys.stderr)
-        elif isinstance(schema[key], dict):
-            is_valid &= validate_config(config[key], schema[key], "sub")
 
-    return is_valid
+def run_sequential_crawl(uri_frontier, doc_db, uri_db, config):
+    """Crawls the URIs in the `uri_frontier` one at a time, lazily yielding each new document found.
 
+    Each URI popped from the front of the frontier is added to `uri_db` first (so that the seeds will not be
+    crawled again) and then crawled by an `OrbAgent` configured with `config["agent_config"]`. New documents
+    yielded by the agent's content processor are yielded in turn, and the new URIs yielded by its link
+    processor are pushed to the back of the frontier. Crawling ends when the frontier is exhausted.
 
-def run_sequential_crawl(doc_str, uri_frontier, doc_db, uri_db, config):
-    """TODO: Implement this function and complete the docstring to explain your logic.
+    Notes:
+        Since this is a generator, pages are crawled only as the resulting documents are consumed; the caller
+        only holds one page's worth of content at a time, instead of the contents of the entire crawl.
 
-    HINT:
-        Interweave `debug_print_*` functions provided to you (below) in your code
-        such that you can visually verify the crawling behavior you implemented.
+    Args:
+        uri_frontier (OrbUriFrontier): frontier populated with the seed URIs to start crawling from.
+        doc_db (SpiderDocDB): database of the fingerprints of the documents seen by the crawl.
+        uri_db (OrbUriDB): database of the URIs seen by the crawl.
+        config (dict): configuration loaded from the config JSON file.
+
+    Yields:
+        Each `OrbDoc` not seen before, in the order the pages were crawled.
 
     """
-    pass
+    while uri_frontier:
+        uri = uri_frontier.pop()
+        uri_db.add(uri)
+        debug_print_current_uri(uri, config)
+
+        docs, links = OrbAgent(uri, doc_db, uri_db, config["agent_config"]).crawl()
+        doc = None
+        for doc in docs:
+            debug_print_current_doc(doc, config)
+            yield doc
+        if doc is None:
+            debug_print_current_doc(doc, config)
+
+        uri_frontier.push_all(*links)
+
+
+def run_parallel_crawl(uri_frontier, doc_db, uri_db, config, workers):
+    """Crawls the URIs in the `uri_frontier` just like `run_sequential_crawl`, except that the pages are opened
+    and parsed by a pool of `workers` processes, lazily yielding each new document found.
+
+    Up to twice as many URIs as there are `workers` are popped from the frontier and submitted to the pool at a
+    time. Each worker process crawls a page with an `OrbAgent` of its own (see `_crawl_page`) and returns only
+    plain data: the contents of the documents and the links found on the page. All duplicate elimination still
+    happens in this (parent) process against `doc_db` and `uri_db`, so no state is shared between the processes.
+
+    Notes:
+        The results are processed strictly in the order the pages were submitted (i.e., popped from the frontier),
+        waiting on the oldest page even if a later one has finished first. Since the links are added to `uri_db`
+        as they are found, popping ahead of time does not change which URIs are popped or in what order, so the
+        documents (and everything computed from them) are exactly those of `run_sequential_crawl`.
+
+    Args:
+        uri_frontier (OrbUriFrontier): frontier populated with the seed URIs to start crawling from.
+        doc_db (SpiderDocDB): database of the fingerprints of the documents seen by the crawl.
+        uri_db (OrbUriDB): database of the URIs seen by the crawl.
+        config (dict): configuration loaded from the config JSON file.
+        workers (int): number of worker processes to parse the pages with.
+
+    Yields:
+        Each `OrbDoc` not seen before, in the order the pages were popped from the frontier.
+
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        while uri_frontier or pending:
+            while uri_frontier and len(pending) < 2 * workers:
+                uri = uri_frontier.pop()
+                uri_db.add(uri)
+                pending.append((uri, executor.submit(_crawl_page, uri.uri, uri.props, config["agent_config"])))
+
+            uri, future = pending.popleft()
+            contents, links = future.result()
+            debug_print_current_uri(uri, config)
+
+            has_doc = False
+            for doc in map(OrbDoc, contents):
+                if doc_db.add(doc.fingerprint):
+                    has_doc = True
+                    debug_print_current_doc(doc, config)
+                    yield doc
+            if not has_doc:
+                debug_print_current_doc(None, config)
+
+            for link in links:
+                link_uri = OrbURI(link, {"parent": uri.uri})
+                if uri_db.add(link_uri):
+                    uri_frontier.push(link_uri)
+
+
+def run_async_crawl(uri_frontier, doc_db, uri_db, config, batch_size):
+    """Crawls the URIs in the `uri_frontier` just like `run_sequential_crawl`, except that up to `batch_size`
+    pages at a time are opened and parsed concurrently, lazily yielding each new document found.
+
+    Each batch of URIs popped from the front of the frontier is crawled by `OrbAgent`'s running in a pool of
+    `batch_size` threads (see `_crawl_batch`), so the file operations of the pages in a batch overlap rather than
+    wait on one another. Once the whole batch is crawled, the documents and the links yielded by the agents are
+    processed in the order the URIs were popped, exactly like `run_sequential_crawl` does.
+
+    Notes:
+        A single event loop and a single thread pool serve every batch of the crawl, rather than a new loop and
+        default executor (capped at `min(32, os.cpu_count() + 4)` threads) per batch. The loop is created and
+        closed by hand (not by `asyncio.Runner`, which needs Python 3.11), since this generator cannot run the whole
+        crawl inside a single `asyncio.run`.
+
+        `OrbAgent.crawl` does not touch the databases (only the processors it returns do, as they are iterated),
+        so the deduplication against `doc_db` and `uri_db` still happens sequentially in this thread.
+
+    Args:
+        uri_frontier (OrbUriFrontier): frontier populated with the seed URIs to start crawling from.
+        doc_db (SpiderDocDB): database of the fingerprints of the documents seen by the crawl.
+        uri_db (OrbUriDB): database of the URIs seen by the crawl.
+        config (dict): configuration loaded from the config JSON file.
+        batch_size (int): maximum number of pages (and their files) to crawl concurrently.
+
+    Yields:
+        Each `OrbDoc` not seen before, in the order the pages were popped from the frontier.
+
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        with ThreadPoolExecutor(max_workers=batch_size) as executor:
+            while uri_frontier:
+                batch = [uri_frontier.pop() for _ in range(min(batch_size, len(uri_frontier)))]
+                uri_db.add_all(*batch)
+
+                agents = [OrbAgent(uri, doc_db, uri_db, config["agent_config"]) for uri in batch]
+                for agent, (docs, links) in zip(agents, loop.run_until_complete(_crawl_batch(agents, executor))):
+                    debug_print_current_uri(agent.uri, config)
+
+                    doc = None
+                    for doc in docs:
+                        debug_print_current_doc(doc, config)
+                        yield doc
+                    if doc is None:
+                        debug_print_current_doc(doc, config)
+
+                    uri_frontier.push_all(*links)
+    finally:
+        loop.close()
+
+
+async def _crawl_batch(agents, executor):
+    """Runs `crawl` of all `agents` concurrently in the threads of `executor`, returning the results in order."""
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*(loop.run_in_executor(executor, agent.crawl) for agent in agents))
+
+
+def _crawl_page(uri, props, agent_config):
+    """Crawls a single page in a worker process of `run_parallel_crawl` with empty databases of its own.
+
+    Returns:
+        A tuple of size 2 containing the contents of the documents and the (normalized) links on the page.
+
+    """
+    agent = OrbAgent(OrbURI(uri, props), OrbDocDB(), OrbUriDB(), agent_config)
+    docs, links = agent.crawl()
+    return [doc.content for doc in docs], [link.uri for link in links]
 
 
 def remove_stopwords(words, config):
-    """TODO: Implement this function and complete the docstring.
+    """Lazily removes the stopwords from `words`, if `config["options"]["remove_stopwords"]` is set to `True`.
 
-    HINT:
-        Use the config dictionary to determine whether to remove stopwords and if so, which language to use;
-        using NLTK's `stopwords` corpus, this should be a relatively simple function to implement.
+    The stopwords are those of NLTK's `stopwords` corpus in the language `config["options"]["stopwords_lang"]`,
+    loaded once per invocation into a `frozenset` for constant time membership checks.
+
+    Args:
+        words (Iterable[str]): lowercase words to remove the stopwords from (e.g., an output of `tokenize_string`).
+        config (dict): configuration loaded from the config JSON file.
+
+    Returns:
+        An iterator over the words that are not stopwords, or `words` itself if stopwords are not to be removed.
 
     """
-    pass
+    options = config["options"]
+    if not options["remove_stopwords"]:
+        return words
+
+    stops = frozenset(stopwords.words(options["stopwords_lang"]))
+    return (word for word in words if word not in stops)
 
 
 def print_twogram_freq(all_words, output_path, config):
-    """TODO: Implement this function and complete the docstring."""
+    """Computes the `TwoGram` frequencies of `all_words` and prints them to `output_path` (or `stdout`).
+
+    The words are counted as they are drawn from `all_words`, so, as the crawl is lazy, only one page of text is
+    held at a time; the last word of a page and the first word of the next one still form a `TwoGram`.
+
+    Args:
+        all_words (Iterable[str]): every word of every document crawled, in the order the crawl yielded them.
+        output_path (str | None): path to the output text file; the frequencies are printed to `stdout` if `None`.
+        config (dict): configuration loaded from the config JSON file.
+
+    """
+    freqs = compute_twogram_freq_stream(all_words)
+    if output_path:
+        with open(output_path, 'w', encoding="UTF-8") as out:
+            print_frequencies(freqs, out)
+    else:
+        print_frequencies(freqs, sys.stdout)
+
+
+def _debug_print_nothing(*args, **kwargs):
+    """Stands in for both `debug_print_*` functions when debugging is off, so the crawl skips their config checks."""
     pass
 
 
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from itertools import count
 
 __author__ = "Mike Ryu"
 __copyright__ = "Copyright 2023, Mike Ryu"
@@ -19,7 +20,18 @@ class SpiderArtifact(ABC):
 
     This class is a parent class for: `SpiderDocFP`, `SpiderDoc`, and `SpiderURI`.
 
+    Notes:
+        `SpiderArtifact`'s are instantiated in large numbers over a crawl, so `SpiderArtifact` and its subclasses
+        declare `__slots__` to avoid having a per-instance `__dict__`.
+
     """
+    __slots__ = ()
+    _type_str = ""  # Cached `str(type(self))` for `__str__` outputs; set per subclass by `__init_subclass__`.
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._type_str = str(cls)
+
     @abstractmethod
     def __hash__(self):
         pass
@@ -33,6 +45,8 @@ class SpiderDocFP(SpiderArtifact):
     representation for debugging purposes.
 
     """
+    __slots__ = ()
+
     @abstractmethod
     def __hash__(self):
         pass
@@ -64,11 +78,11 @@ class SpiderDoc(SpiderArtifact):
         _fingerprint (SpiderDOcFP): lazily computed document fingerprint.
 
     """
-    _iid = 0
+    __slots__ = ("_iid", "_title", "_content", "_fingerprint")
+    _iid_counter = count(1)
 
     def __init__(self, content: str, title: str = None) -> None:
-        SpiderDoc._iid += 1
-        self._iid: int = SpiderDoc._iid
+        self._iid: int = next(SpiderDoc._iid_counter)
         self._title: str | None = title
         self._content: str = content
         self._fingerprint: SpiderDocFP | None = None
@@ -80,16 +94,12 @@ class SpiderDoc(SpiderArtifact):
         if other is None or not isinstance(other, SpiderDoc):
             return False
         else:
-            return self._fingerprint == other.fingerprint
+            return self.fingerprint == other.fingerprint
 
     def __str__(self) -> str:
-        is_truncate = len(self._content) >= TRUNCATION_THRESHOLD
-        return "[{hash:20d}]: {content}{ellipses} {type}".format(
-            hash=self.__hash__(),
-            content=self._content[:TRUNCATION_THRESHOLD if is_truncate else len(self._content)],
-            ellipses="..." if is_truncate else "    ",
-            type=type(self)
-        )
+        content = self._content
+        ellipses = "..." if len(content) >= TRUNCATION_THRESHOLD else "    "
+        return f"[{self.__hash__():20d}]: {content[:TRUNCATION_THRESHOLD]}{ellipses} {self._type_str}"
 
     @property
     def iid(self) -> int:
@@ -105,9 +115,11 @@ class SpiderDoc(SpiderArtifact):
 
     @property
     def fingerprint(self) -> SpiderDocFP:
-        if not self._fingerprint:
+        fp = self._fingerprint
+        if fp is None:
             self._compute_fingerprint()
-        return self._fingerprint
+            fp = self._fingerprint
+        return fp
 
     @abstractmethod
     def _compute_fingerprint(self) -> None:
@@ -124,15 +136,18 @@ class SpiderURI(SpiderArtifact):
         _iid (int): instance ID (automatically increments per instantiation).
         _uri (str): actual URI string; in most cases, this should be a normalized URI.
         _props (dict): properties to attach to this URI, up to the implementing class.
+        _hash (int): hash of `_uri`, computed once at instantiation for implementing classes to reuse; it is not
+            pickled but recomputed upon unpickling, since the hash of a `str` is salted differently per process.
 
     """
-    _iid = 0
+    __slots__ = ("_iid", "_uri", "_props", "_hash")
+    _iid_counter = count(1)
 
     def __init__(self, uri: str, props: dict = None) -> None:
-        SpiderURI._iid += 1
-        self._iid: int = SpiderURI._iid
+        self._iid: int = next(SpiderURI._iid_counter)
         self._uri: str = uri
         self._props: dict | None = props
+        self._hash: int = hash(uri)
 
     @abstractmethod
     def __hash__(self) -> int:
@@ -142,16 +157,19 @@ class SpiderURI(SpiderArtifact):
         if other is None or not isinstance(other, SpiderURI):
             return False
         else:
-            return self._uri == other.uri
+            return self._hash == other._hash and self._uri == other._uri
+
+    def __getstate__(self) -> tuple:
+        return self._iid, self._uri, self._props
+
+    def __setstate__(self, state: tuple) -> None:
+        self._iid, self._uri, self._props = state
+        self._hash = hash(self._uri)
 
     def __str__(self) -> str:
-        is_truncate = len(self._uri) >= TRUNCATION_THRESHOLD
-        return "[{iid:09d}]: {ellipses}{uri} {type}".format(
-            iid=self._iid,
-            uri=self._uri[-TRUNCATION_THRESHOLD if is_truncate else len(self._uri):],
-            ellipses="..." if is_truncate else "    ",
-            type=type(self)
-        )
+        uri = self._uri
+        ellipses = "..." if len(uri) >= TRUNCATION_THRESHOLD else "    "
+        return f"[{self._iid:09d}]: {ellipses}{uri[-TRUNCATION_THRESHOLD:]} {self._type_str}"
 
     @property
     def iid(self) -> int:
@@ -183,6 +201,8 @@ class SpiderProcessor(ABC):
         _agent (SpiderAgent): reference back to the `SpiderAgent` agent instance that yields this processor.
 
     """
+    __slots__ = ("_agent",)
+
     def __init__(self, agent: SpiderAgent) -> None:
         self._agent: SpiderAgent = agent
 
@@ -221,6 +241,8 @@ class SpiderContentProcessor(SpiderProcessor):
         _doc_db (SpiderDocDB): a direct reference to the `SpiderDocDB` used by the crawler agent (`self._agent`).
 
     """
+    __slots__ = ("_doc_db",)
+
     def __init__(self, agent: SpiderAgent) -> None:
         super().__init__(agent)
         self._doc_db: SpiderDocDB = self._agent.doc_db
@@ -240,6 +262,8 @@ class SpiderLinkProcessor(SpiderProcessor):
         _uri_db (SpiderUriDB): a direct reference to the `SpiderUriDB` used by the crawler agent (`self._agent`).
 
     """
+    __slots__ = ("_uri_db",)
+
     def __init__(self, agent: SpiderAgent) -> None:
         super().__init__(agent)
         self._uri_db: SpiderUriDB = self._agent.uri_db
@@ -265,11 +289,11 @@ class SpiderAgent(ABC):
         _config (dict): arbitrary configuration key-value pairs for required by the implementing class.
 
     """
-    _iid = 0
+    __slots__ = ("_iid", "_uri", "_doc_db", "_uri_db", "_config")
+    _iid_counter = count(1)
 
     def __init__(self, uri: SpiderURI, doc_db: SpiderDocDB, uri_db: SpiderUriDB, config: dict) -> None:
-        SpiderAgent._iid += 1
-        self._iid: int = SpiderAgent._iid
+        self._iid: int = next(SpiderAgent._iid_counter)
         self._uri: SpiderURI = uri
         self._doc_db: SpiderDocDB = doc_db
         self._uri_db: SpiderUriDB = uri_db
@@ -334,6 +358,8 @@ class SpiderUriFrontier(ABC):
         empty list will raise a `ValueError`.
 
     """
+    __slots__ = ()
+
     def __init__(self, seeds: list[SpiderURI]) -> None:
         if not seeds:
             raise ValueError("Seed list of URIs are required.")
@@ -380,6 +406,8 @@ class SpiderDB(ABC):
     This class is a superclass for: `SpiderDocDB` and `SpiderUriDB`.
 
     """
+    __slots__ = ()
+
     def __bool__(self) -> bool:
         """Returns `True` if the DB is empty, `False` otherwise."""
         return len(self) > 0
@@ -425,6 +453,8 @@ class SpiderDocDB(SpiderDB):
     by storing the `SpiderDocFP`'s (but not the `SpiderDoc`'s themselves); extends `SpiderDB`.
 
     """
+    __slots__ = ()
+
     @abstractmethod
     def __len__(self) -> int:
         pass
@@ -447,6 +477,8 @@ class SpiderUriDB(SpiderDB):
     by storing the `SpiderURI`'s themselves; extends `SpiderDB`.
 
     """
+    __slots__ = ()
+
     @abstractmethod
     def __len__(self) -> int:
         pass
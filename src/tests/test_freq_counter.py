@@ -7,8 +7,9 @@ import sys
 import unittest
 
 from text_processing.freq_models import TwoGram
-from text_processing.freq_utils import tokenize_file, print_frequencies
-from text_processing.freq_counter import compute_word_freq, compute_twogram_freq
+from text_processing.freq_utils import tokenize_file, print_frequencies, print_frequencies_soa
+from text_processing.freq_counter import (compute_word_freq, compute_word_freq_soa, compute_twogram_freq,
+                                         compute_twogram_freq_stream, aggregate_word_freq)
 
 __author__ = "Boaty McBoatface, Planey McPlaneface"
 __copyright__ = "Copyright 2023, Westmont College"
@@ -47,6 +48,42 @@ class ComputeWordFreqTest(unittest.TestCase):
         actual_list = compute_word_freq(["this", "sentence", "repeats", "the", "word", "sentence"])
         self.assertEqual(expected_list, list(map(str, actual_list)))
 
+    def test_compute_word_freq_top(self):
+        with open(self.sample_paths[4], 'r') as fo:
+            words = tokenize_file(fo)
+
+        freqs = compute_word_freq(words)
+        for top in (0, 1, 10, len(freqs), len(freqs) + 1):
+            self.assertEqual(freqs[:top], compute_word_freq(words, top))
+
+    def test_compute_word_freq_soa_example(self):
+        self.assertEqual(([], []), tuple(map(list, compute_word_freq_soa(None))))
+
+        words, counts = compute_word_freq_soa(["this", "sentence", "repeats", "the", "word", "sentence"])
+        self.assertEqual(["sentence", "repeats", "the", "this", "word"], words)
+        self.assertEqual([2, 1, 1, 1, 1], list(counts))
+
+    def test_compute_word_freq_soa_sample_04(self):
+        with open(self.sample_paths[4], 'r') as fo:
+            words = tokenize_file(fo)
+
+        expected_out_stream = io.StringIO()
+        print_frequencies(compute_word_freq(words), expected_out_stream)
+
+        actual_out_stream = io.StringIO()
+        print_frequencies_soa(*compute_word_freq_soa(words), actual_out_stream)
+        self.assertEqual(expected_out_stream.getvalue(), actual_out_stream.getvalue())
+
+    def test_aggregate_word_freq(self):
+        self.assertEqual([], aggregate_word_freq([]))
+
+        words = []
+        for path in self.sample_paths:
+            with open(path, 'r', encoding="UTF-8") as fo:
+                words.extend(tokenize_file(fo))
+
+        self.assertEqual(compute_word_freq(words), aggregate_word_freq(self.sample_paths, workers=2))
+
     def test_compute_word_freq_sample_04(self):
         with open(self.sample_paths[4], 'r') as fo:
             words = tokenize_file(fo)
@@ -266,6 +303,24 @@ class ComputeTwoGramFreqTest(unittest.TestCase):
             self.assertEqual("     1 <a:m>\n", actual_out_lines[3])
             self.assertEqual("     1 <aa:r>\n", actual_out_lines[4])
 
+    def test_compute_twogram_freq_stream(self):
+        self.assertEqual([], compute_twogram_freq_stream(iter([])))
+        self.assertEqual([], compute_twogram_freq_stream(iter(["alone"])))
+
+        with open(self.in_paths[6], 'r', encoding="UTF-8") as fo:
+            words = tokenize_file(fo)
+
+        self.assertEqual(compute_twogram_freq(words), compute_twogram_freq_stream(word for word in words))
+        self.assertEqual(compute_twogram_freq(words, 12), compute_twogram_freq_stream(iter(words), 12))
+
+    def test_compute_twogram_freq_top(self):
+        with open(self.in_paths[6], 'r', encoding="UTF-8") as fo:
+            words = tokenize_file(fo)
+
+        freqs = compute_twogram_freq(words)
+        for top in (0, 1, 12, len(freqs), len(freqs) + 1):
+            self.assertEqual(freqs[:top], compute_twogram_freq(words, top))
+
     def test_compute_twogram_freq_06(self):
         with open(self.in_paths[6], 'r', encoding="UTF-8") as fo:
             words = tokenize_file(fo)
@@ -174,6 +174,17 @@ class TwoGramTest(unittest.TestCase):
         self.assertTrue(self.tg_6th >= self.tg_5th)
         self.assertTrue(self.tg_6th >= self.tg_6th_tied)
 
+    def test_compare_token_pairs(self):
+        ordered = [self.tg_top, self.tg_1st, self.tg_2nd, self.tg_3rd, self.tg_4th, self.tg_5th, self.tg_6th]
+        for i, tg in enumerate(ordered):
+            self.assertEqual(1, tg._compare_token_pairs(None))
+            for j, other in enumerate(ordered):
+                self.assertEqual((i > j) - (i < j), tg._compare_token_pairs(other))
+
+        self.assertEqual(0, self.tg_6th._compare_token_pairs(self.tg_6th_tied))
+        self.assertEqual(1, self.tg1._compare_token_pairs(self.tg2))
+        self.assertEqual(-1, self.tg2._compare_token_pairs(self.tg1))
+
 
 class FrequencyTest(unittest.TestCase):
     def setUp(self):
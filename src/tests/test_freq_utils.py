@@ -3,9 +3,12 @@
 
 import io
 import os
+import pickle
+import tempfile
 import unittest
 
-from text_processing.freq_utils import tokenize_file, print_frequencies
+from text_processing.freq_utils import (TOKEN_PATTERN, tokenize_file, tokenize_file_cached, tokenize_string,
+                                        print_frequencies)
 from text_processing.freq_models import Frequency
 
 __author__ = "Boaty McBoatface, Planey McPlaneface"
@@ -76,6 +79,53 @@ class TokenizeFileTest(unittest.TestCase):
             self.assertEqual("123",    words[8])
             self.assertEqual("45",     words[9])
 
+    def test_cached(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for path in self.sample_paths:
+                with open(path, 'r', encoding="UTF-8") as fo:
+                    expected_words = tokenize_file(fo)
+
+                self.assertEqual(expected_words, tokenize_file_cached(path, cache_dir))  # Cache miss.
+                self.assertEqual(expected_words, tokenize_file_cached(path, cache_dir))  # Cache hit.
+
+            self.assertEqual(len(set(self.sample_paths)), len(os.listdir(cache_dir)))
+
+    def test_cached_corrupt(self):
+        with open(self.sample_paths[4], 'r', encoding="UTF-8") as fo:
+            expected_words = tokenize_file(fo)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            tokenize_file_cached(self.sample_paths[4], cache_dir)
+            (cache_name,) = os.listdir(cache_dir)
+            cache_path = os.path.join(cache_dir, cache_name)
+
+            with open(cache_path, 'rb') as cache_fo:
+                intact = cache_fo.read()
+
+            corruptions = [
+                intact[:len(intact) // 2],  # Truncated in the middle of the tokens.
+                intact[:intact.index(b"\n") + 1],  # Truncated right after the number of tokens.
+                intact[:-1],  # Missing the last line break.
+                b"\xff\xfe" + intact,  # Not UTF-8.
+                b"",
+                pickle.dumps(expected_words),  # A cache file of the old (pickled) format is never unpickled.
+            ]
+            for corrupt in corruptions:
+                with open(cache_path, 'wb') as cache_fo:
+                    cache_fo.write(corrupt)
+
+                self.assertEqual(expected_words, tokenize_file_cached(self.sample_paths[4], cache_dir))  # Regenerated.
+                self.assertEqual(expected_words, tokenize_file_cached(self.sample_paths[4], cache_dir))  # Cache hit.
+                self.assertEqual([cache_name], os.listdir(cache_dir))
+
+                with open(cache_path, 'rb') as cache_fo:
+                    self.assertEqual(intact, cache_fo.read())
+
+    def test_ascii_matches_pattern(self):
+        text = "".join(map(chr, range(0x80))) * 2 + " Isn't_it 123-45 (or\tnot)\r\n'quoted'"
+        self.assertTrue(text.isascii())
+        self.assertEqual(TOKEN_PATTERN.findall(text.lower()), tokenize_string(text))
+
 
 class PrintFrequenciesTest(unittest.TestCase):
     def test_static(self):
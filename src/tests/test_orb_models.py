@@ -1,8 +1,12 @@
 """Unit tests for functions in `spider.orb.orb_models`.
 """
 
+import io
 import os
 import unittest
+from unittest import mock
+from lxml import etree
+from parameterized import parameterized_class
 from spider.orb.orb_models import *
 
 __author__ = "Mike Ryu"
@@ -12,17 +16,27 @@ __license__ = "MIT"
 __email__ = "dongyub.ryu@gmail.com"
 
 
+@parameterized_class([
+    {"parser": "html.parser"},
+    {"parser": "lxml"},
+    {"parser": "lexbor"},
+    {"parser": "iterparse"}
+])
 class OrbAgentTest(unittest.TestCase):
-    def setUp(self):
+    parser = "lxml"
+
+    @classmethod
+    def setUpClass(cls):
         cwd = os.path.dirname(__file__)
         host_path = "./data"
         page_path = host_path + "/spider.orb_{:02d}.in.html"
 
-        num_samples = 5
-        sample_paths = [os.path.relpath(page_path.format(i), cwd) for i in range(num_samples)]
+        num_samples = 9
+        cls.sample_paths = [os.path.relpath(page_path.format(i), cwd) for i in range(num_samples)]
+        cls.host = os.path.relpath(host_path, cwd)
 
-        self.host = os.path.relpath(host_path, cwd)
-        self.uris = [OrbURI(sample_paths[i], dict()) for i in range(num_samples)]
+    def setUp(self):
+        self.uris = [OrbURI(sample_path, dict()) for sample_path in self.sample_paths]
 
         self.dummy_doc_db = OrbDocDB()
         self.dummy_uri_db = OrbUriDB()
@@ -30,7 +44,7 @@ class OrbAgentTest(unittest.TestCase):
         self.base_config = {
             "external": ["https://", "http://"],
             "encoding": "UTF-8",
-            "parser": "html.parser",
+            "parser": self.parser,
             "debug": True
         }
 
@@ -118,7 +132,7 @@ class OrbAgentTest(unittest.TestCase):
             next(content)
 
         try:
-            all_links = [_.uri for _ in link]
+            all_links = {_.uri for _ in link}
             self.assertTrue(f"{self.host}/spider.orb_01.in.html" in all_links)
             self.assertTrue(f"{self.host}/spider.orb_02.in.html" in all_links)
             self.assertTrue("https://www.mikeryu.com" in all_links)
@@ -151,7 +165,7 @@ class OrbAgentTest(unittest.TestCase):
             next(content)
 
         try:
-            all_links = [_.uri for _ in link]
+            all_links = {_.uri for _ in link}
             self.assertTrue(f"{self.host}/index.htm" in all_links)
             self.assertTrue(f"{self.host}/07015.htm" in all_links)
             self.assertTrue(f"{self.host}/07017.htm" in all_links)
@@ -179,14 +193,94 @@ class OrbAgentTest(unittest.TestCase):
         with self.assertRaises(StopIteration):
             next(links)
 
+    def test_crawl_6_valueless_href(self):
+        config = dict(self.base_config)
+        config["tags"] = {"p": {}}
+        agent = OrbAgent(self.uris[5], self.dummy_doc_db, self.dummy_uri_db, config)
+        content, link = agent.crawl()
+
+        self.assertEqual("A link without a value:", next(content).content)
+        self.assertEqual({self.host, f"{self.host}/spider.orb_01.in.html"}, {_.uri for _ in link})
+
+    def test_crawl_7_misencoded_byte(self):
+        config = dict(self.base_config)
+        config["tags"] = {"p": {}}
+        agent = OrbAgent(self.uris[6], self.dummy_doc_db, self.dummy_uri_db, config)
+        content, link = agent.crawl()
+
+        # A Latin-1 "é" in a page configured as UTF-8; `BeautifulSoup` may still guess the right encoding.
+        self.assertIn(next(content).content, ("Caf\ufffd au lait", "Caf\u00e9 au lait"))
+        with self.assertRaises(StopIteration):
+            next(link)
+
+    def test_crawl_8_comments(self):
+        config = dict(self.base_config)
+        config["tags"] = {"p": {}}
+        agent = OrbAgent(self.uris[7], self.dummy_doc_db, self.dummy_uri_db, config)
+        content, link = agent.crawl()
+
+        self.assertEqual("Visible  text", next(content).content)
+
+    def test_crawl_9_attr_values_with_quote_and_backslash(self):
+        cases = [('say "hi"', "Quoted"), ("back\\slash", "Backslash"), (["plain", 'say "hi"'], "Quoted Plain")]
+        for value, expected in cases:
+            config = dict(self.base_config)
+            config["tags"] = {"p": {"title": value}}
+            agent = OrbAgent(self.uris[8], OrbDocDB(), self.dummy_uri_db, config)
+            content, link = agent.crawl()
+
+            self.assertEqual(expected, next(content).content)
+
+    def test_crawl_10_attr_present(self):
+        config = dict(self.base_config)
+        config["tags"] = {"p": {"title": True}}
+        agent = OrbAgent(self.uris[8], self.dummy_doc_db, self.dummy_uri_db, config)
+        content, link = agent.crawl()
+
+        self.assertEqual("Quoted Backslash Plain Empty", next(content).content)
+
+    def test_external_pattern_shared_by_agents(self):
+        first = OrbAgent(self.uris[0], self.dummy_doc_db, self.dummy_uri_db, dict(self.base_config))
+        second = OrbAgent(self.uris[1], self.dummy_doc_db, self.dummy_uri_db, dict(self.base_config))
+
+        self.assertIs(first.external_pattern, second.external_pattern)
+        self.assertTrue(OrbLinkProcessor.is_link_external(first, "https://example.com"))
+        self.assertFalse(OrbLinkProcessor.is_link_external(second, "spider.orb_01.in.html"))
+
+
+class OrbAgentIterparseTest(unittest.TestCase):
+    def test_parsed_elements_are_discarded(self):
+        row = b"<div><span>%d</span> <dd>Verse %d <b>and</b> more</dd><a href='%d.htm'>go</a></div>"
+        page = io.BytesIO(b"<html><body>" + b"".join(row % (i, i, i) for i in range(100)) + b"</body></html>")
+        config = {"external": [], "encoding": "UTF-8", "parser": "iterparse", "debug": False, "tags": {"dd": {}}}
+        agent = OrbAgent(OrbURI("page.html"), OrbDocDB(), OrbUriDB(), config)
+
+        parsers = []
+        iterparse = etree.iterparse
+
+        def recording_iterparse(*args, **kwargs):
+            parsers.append(iterparse(*args, **kwargs))
+            return parsers[-1]
+
+        with mock.patch.object(etree, "iterparse", side_effect=recording_iterparse):
+            texts, links = agent._parse_with_iterparse(page)
+
+        self.assertEqual(["Verse {:d}  more".format(i) for i in range(100)], texts)
+        self.assertEqual(["{:d}.htm".format(i) for i in range(100)], links)
+        self.assertEqual(["html"], [elem.tag for elem in parsers[0].root.iter()])
+
 
 class OrbUriFrontierTest(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         cwd = os.path.dirname(__file__)
         num_samples = 5
 
-        sample_paths = [os.path.relpath("./data/spider.orb_{:02d}.in.html".format(i), cwd) for i in range(num_samples)]
-        self.uris = [OrbURI(sample_paths[i], dict()) for i in range(num_samples)]
+        cls.sample_paths = [os.path.relpath("./data/spider.orb_{:02d}.in.html".format(i), cwd)
+                            for i in range(num_samples)]
+
+    def setUp(self):
+        self.uris = [OrbURI(sample_path, dict()) for sample_path in self.sample_paths]
 
     def test_constructor_bool_and_len(self):
         with self.assertRaises(ValueError):
@@ -226,3 +320,71 @@ class OrbUriFrontierTest(unittest.TestCase):
             self.assertEqual(init_len - j - 1, len(frontier))
 
         self.assertFalse(frontier)
+
+
+class OrbDBTest(unittest.TestCase):
+    @staticmethod
+    def make_fp(value):
+        fp = OrbDocFP("")
+        fp._fp = value
+        return fp
+
+    def test_doc_db_colliding_hashes(self):
+        # `hash` reduces a fingerprint of 2**63 or more modulo 2**61 - 1, so these two share a hash value.
+        high = self.make_fp(2 ** 63 + 5)
+        low = self.make_fp(hash(high))
+        self.assertEqual(hash(low), hash(high))
+
+        for db in (OrbDocDB(), OrbCompactDocDB()):
+            self.assertTrue(db.add(low))
+            self.assertNotIn(high, db)
+            self.assertTrue(db.add(high))
+            self.assertEqual(2, len(db))
+            self.assertTrue(db.remove(low))
+            self.assertIn(high, db)
+
+    def test_uri_db_colliding_hashes(self):
+        first, second = OrbURI("first.html"), OrbURI("second.html")
+        second._hash = first._hash
+
+        db = OrbUriDB()
+        self.assertTrue(db.add(first))
+        self.assertNotIn(second, db)
+        self.assertTrue(db.add(second))
+        self.assertFalse(db.add(second))
+        self.assertEqual(2, len(db))
+
+
+class OrbCompactDocDBTest(unittest.TestCase):
+    def setUp(self):
+        self.fps = [OrbDocFP("document {:d}".format(i)) for i in range(100)]
+
+    def test_constructor_invalid_capacity(self):
+        for capacity in (0, 3, 1000):
+            with self.assertRaises(ValueError):
+                OrbCompactDocDB(capacity)
+
+    def test_add_contains_and_len(self):
+        db = OrbCompactDocDB(4)
+        self.assertEqual(0, len(db))
+
+        for i, fp in enumerate(self.fps):
+            self.assertNotIn(fp, db)
+            self.assertTrue(db.add(fp))
+            self.assertFalse(db.add(OrbDocFP("document {:d}".format(i))))
+            self.assertIn(fp, db)
+            self.assertEqual(i + 1, len(db))
+
+    def test_remove(self):
+        db = OrbCompactDocDB(4)
+        for fp in self.fps:
+            db.add(fp)
+
+        for i, fp in enumerate(self.fps[::2]):
+            self.assertTrue(db.remove(fp))
+            self.assertFalse(db.remove(fp))
+            self.assertNotIn(fp, db)
+            self.assertEqual(len(self.fps) - i - 1, len(db))
+
+        for fp in self.fps[1::2]:
+            self.assertIn(fp, db)
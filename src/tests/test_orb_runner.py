@@ -0,0 +1,61 @@
+"""Unit tests for functions in `spider.orb.orb_runner`.
+"""
+
+import os
+import unittest
+from spider.orb.orb_models import OrbURI, OrbUriFrontier, OrbDocDB, OrbUriDB
+from spider.orb.orb_runner import run_sequential_crawl, run_parallel_crawl, run_async_crawl
+from text_processing.freq_counter import compute_twogram_freq_stream
+from text_processing.freq_utils import tokenize_string
+
+__author__ = "Boaty McBoatface, Planey McPlaneface"
+__copyright__ = "Copyright 2023, Westmont College"
+__credits__ = ["Boaty McBoatface", "Planey McPlaneface", "Mike Ryu"]
+__license__ = "MIT"
+__email__ = "mryu@westmont.edu"
+
+
+class OrbRunnerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cwd = os.path.dirname(__file__)
+        cls.seed = os.path.relpath("./data/spider.orb_03.in.html", cwd)
+
+    def setUp(self):
+        self.config = {
+            "agent_config": {
+                "external": ["https://", "http://"],
+                "encoding": "UTF-8",
+                "parser": "lxml",
+                "tags": {"p": {}, "h1": {}, "h2": {}},
+                "debug": False
+            }
+        }
+
+    def crawl(self, run, *args):
+        uri_frontier = OrbUriFrontier([OrbURI(self.seed)])
+        return [doc.content for doc in run(uri_frontier, OrbDocDB(), OrbUriDB(), self.config, *args)]
+
+    @staticmethod
+    def twograms(contents):
+        return [str(freq) for freq in compute_twogram_freq_stream(
+            word for content in contents for word in tokenize_string(content))]
+
+    def test_parallel_crawl_matches_sequential(self):
+        expected = self.crawl(run_sequential_crawl)
+        self.assertGreater(len(expected), 1)
+
+        for workers in (2, 3, 4):
+            actual = self.crawl(run_parallel_crawl, workers)
+            self.assertEqual(expected, actual)
+            self.assertEqual(self.twograms(expected), self.twograms(actual))
+
+    def test_async_crawl_matches_sequential(self):
+        expected = self.crawl(run_sequential_crawl)
+
+        for batch_size in (2, 8):
+            self.assertEqual(expected, self.crawl(run_async_crawl, batch_size))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 """Unit tests for functions in `spider.spider_models`.
 """
 
+import pickle
 import unittest
 from parameterized import parameterized_class
 from spider.orb.orb_models import *
@@ -111,6 +112,15 @@ class SpiderImplUriTest(unittest.TestCase):
         self.assertEqual(self.uri, self.SpiderImplUri(self.fake_uri, None))
         self.assertEqual(self.uri, self.SpiderImplUri(self.fake_uri, self.fake_props))
 
+    def test_pickle(self):
+        self.uri._hash += 1  # As if pickled in another process, whose `str` hashes are salted differently.
+        unpickled = pickle.loads(pickle.dumps(self.uri))
+
+        fresh = self.SpiderImplUri(self.fake_uri, None)
+        self.assertEqual(fresh, unpickled)
+        self.assertEqual(hash(fresh), hash(unpickled))
+        self.assertEqual((self.uri.iid, self.uri.uri, self.uri.props), (unpickled.iid, unpickled.uri, unpickled.props))
+
     def test_str(self):
         self.assertEqual(
             f"[{self.uri.iid:09d}]: ...me/page/that/is/fake {self.SpiderImplUriTypeStr}",
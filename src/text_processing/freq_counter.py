@@ -4,6 +4,14 @@
 
 import sys
 import argparse
+import heapq
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import pairwise
+from operator import iadd, itemgetter
+from typing import Iterable
 from text_processing.freq_models import TwoGram, Frequency
 from text_processing.freq_utils import tokenize_file, print_frequencies
 
@@ -18,23 +26,26 @@ __email__ = "mryu@westmont.edu"
 def main() -> None:
     pars = setup_argument_parser()
     args = pars.parse_args()
-    if args.processing_mode not in [1, 2]:
-        pars.error("Processing mode must be either 1 (word) or 2 (twogram).")
 
     try:
-        # TODO: stitch everything together HERE.
-        # TODO: when `open`ing a file, use `encoding="UTF-8"`
+        with open(args.input_file_path, 'r', encoding="UTF-8") as fo:
+            tokens = tokenize_file(fo)
+
+        compute_freq = compute_word_freq if args.processing_mode == 1 else compute_twogram_freq
+        freqs = compute_freq(tokens)
+
+        with open(args.output_file_path, 'w', encoding="UTF-8") as out:
+            print_frequencies(freqs, out)
 
-        # TODO: print the output to `sys.stdout` stream if the `-v` switch/flag was given.
         if args.verbose:  # DO NOT get rid of this -- this will be useful in debugging.
-            pass
+            print_frequencies(freqs, sys.stdout)
     except OSError as e:  # Leave this `except` block as-is.
         print("An error occurred while trying to open files:\n  ", e, file=sys.stderr)
 
 
 def setup_argument_parser():
     pars = argparse.ArgumentParser()
-    pars.add_argument("processing_mode", type=int,
+    pars.add_argument("processing_mode", type=int, choices=(1, 2),
                       help="required integer to select desired processing mode, either 1 (word) or 2 (twogram)")
     pars.add_argument("input_file_path", type=str,
                       help="required string containing the path to a text file to process")
@@ -45,7 +56,7 @@ def setup_argument_parser():
     return pars
 
 
-def compute_word_freq(tokens: list[str]) -> list[Frequency]:
+def compute_word_freq(tokens: list[str], top: int = None) -> list[Frequency]:
     """Takes the input list of words and processes it, returning a list of `Frequency`s.
 
     This function expects a list of lowercase alphanumeric strings (in any spoken language).
@@ -57,6 +68,7 @@ def compute_word_freq(tokens: list[str]) -> list[Frequency]:
     Args:
         tokens (list[str]): list of lowercase words in any spoken language including numbers (e.g., 1, 123).
                             This list will not be modified.
+        top (int): if given, only the `top` most frequent words are returned; the rest are never sorted.
 
     Yields:
         A list ordered by decreasing frequency, with tied words sorted lexicographically.
@@ -66,11 +78,66 @@ def compute_word_freq(tokens: list[str]) -> list[Frequency]:
         >>> print(list(map(str, word_freq)))
         ["sentence:2", "repeats:1", "the:1", "this:1",  "word:1"]
     """
-    # TODO: implement me
-    return []
+    return _wrap_frequencies(_compute_word_freq_tuples(tokens, top))
+
+
+def compute_word_freq_soa(tokens: list[str]) -> (list[str], array):
+    """Counts the words the same way `compute_word_freq` does, but returns the result as two parallel sequences
+    (a "structure of arrays") instead of a list of `Frequency` objects.
+
+    The counts are packed in an `array` of signed 64-bit integers, so no `Frequency` (nor a boxed `int` per
+    word) has to be kept around when only the words and their counts are needed.
+
+    Args:
+        tokens (list[str]): list of lowercase words in any spoken language including numbers (e.g., 1, 123).
+                            This list will not be modified.
+
+    Returns:
+        A tuple of size 2 containing the unique words and their counts, respectively, both ordered by decreasing
+        count, with tied words sorted lexicographically. Both are empty if `tokens` is `None` or empty.
+
+    Example:
+        >>> words, counts = compute_word_freq_soa(["this", "sentence", "repeats", "the", "word", "sentence"])
+        >>> print(words, counts.tolist())
+        ['sentence', 'repeats', 'the', 'this', 'word'] [2, 1, 1, 1, 1]
+    """
+    items = _compute_word_freq_tuples(tokens)
+    return [word for word, _ in items], array("q", [count for _, count in items])
+
 
+def aggregate_word_freq(paths: list[str], workers: int = None) -> list[Frequency]:
+    """Computes the word frequencies over all the text files at `paths`, tokenizing and counting each file in
+    a separate process, then merging the counts.
 
-def compute_twogram_freq(tokens: list[str]) -> list[Frequency]:
+    The files are processed in parallel by up to `workers` processes (`os.cpu_count()` of them if `None`), each
+    returning a `Counter` of its file's tokens; the result is ordered exactly like that of `compute_word_freq`
+    given the tokens of all the files.
+
+    Args:
+        paths (list[str]): paths to the UTF-8 encoded text files to count the words of.
+        workers (int): maximum number of worker processes to use.
+
+    Returns:
+        A list ordered by decreasing frequency, with tied words sorted lexicographically.
+
+    Raises:
+        OSError: If any of the files cannot be opened.
+    """
+    if not paths:
+        return []
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        counts = reduce(iadd, executor.map(_tokenize_and_count, paths), Counter())
+    return _wrap_frequencies(_sort_by_decreasing_count(counts))
+
+
+def _tokenize_and_count(path: str) -> Counter:
+    """Tokenizes the text file at `path` in a worker process of `aggregate_word_freq`, returning the word counts."""
+    with open(path, 'r', encoding="UTF-8") as fo:
+        return Counter(tokenize_file(fo))
+
+
+def compute_twogram_freq(tokens: list[str], top: int = None) -> list[Frequency]:
     """Takes the input list of words and processes it, returning a list of `Frequency`s.
 
     This function expects a list of tokens. If the input list is `None` or empty, an empty list is returned.
@@ -80,6 +147,7 @@ def compute_twogram_freq(tokens: list[str]) -> list[Frequency]:
 
     Args:
         tokens (list[str]): list of `TwoGrams`. This list will not be modified.
+        top (int): if given, only the `top` most frequent `TwoGram`s are returned; the rest are never sorted.
 
     Yields:
         A list ordered by decreasing frequency, with tied `TwoGram`s sorted lexicographically.
@@ -98,8 +166,79 @@ def compute_twogram_freq(tokens: list[str]) -> list[Frequency]:
              1 <think:you>
              1 <you:know>
     """
-    # TODO: implement me
-    return []
+    return _wrap_twogram_frequencies(_compute_twogram_freq_tuples(tokens, top))
+
+
+def compute_twogram_freq_stream(tokens: Iterable[str], top: int = None) -> list[Frequency]:
+    """Computes the `TwoGram` frequencies of `tokens` exactly like `compute_twogram_freq`, except that `tokens` may be
+    any iterable (e.g., a generator over the words of a crawl), which is consumed only once.
+
+    The pairs of adjacent tokens are counted as they are drawn from `tokens`, so the tokens are never gathered into
+    a list; only the counts of the unique pairs are held in memory.
+
+    Args:
+        tokens (Iterable[str]): tokens to count the `TwoGram`s of, in order.
+        top (int): if given, only the `top` most frequent `TwoGram`s are returned; the rest are never sorted.
+
+    Returns:
+        A list ordered by decreasing frequency, with tied `TwoGram`s sorted lexicographically.
+    """
+    return _wrap_twogram_frequencies(_sort_by_decreasing_count(Counter(pairwise(tokens)), top))
+
+
+def _compute_word_freq_tuples(tokens: list[str], top: int = None) -> list[tuple[str, int]]:
+    """Returns the (word, count) tuples of `tokens`, ordered like the `Frequency`s of `compute_word_freq`.
+
+    Notes:
+        The counting is left to `Counter(tokens)`, whose C helper (`_count_elements`) counts every token in a
+        single pass; the dict cannot be pre-sized from Python, and it only resizes as the unique words (not
+        the tokens) grow, which is a handful of times for a Zipfian vocabulary.
+
+    """
+    if not tokens:
+        return []
+    return _sort_by_decreasing_count(Counter(tokens), top)
+
+
+def _compute_twogram_freq_tuples(tokens: list[str], top: int = None) -> list[tuple[tuple[str, str], int]]:
+    """Returns the ((token1, token2), count) tuples of `tokens`, ordered like the `Frequency`s of
+    `compute_twogram_freq`; each pair of adjacent tokens is a plain `tuple` rather than a `TwoGram`."""
+    if not tokens:
+        return []
+    return _sort_by_decreasing_count(Counter(pairwise(tokens)), top)
+
+
+def _wrap_frequencies(items: list[tuple[str, int]]) -> list[Frequency]:
+    """Wraps each (word, count) tuple in a `Frequency`, keeping the order of `items`."""
+    return [Frequency(word, freq) for word, freq in items]
+
+
+def _wrap_twogram_frequencies(items: list[tuple[tuple[str, str], int]]) -> list[Frequency]:
+    """Wraps each ((token1, token2), count) tuple in a `Frequency` of a `TwoGram`, keeping the order of `items`."""
+    return [Frequency(TwoGram(token1, token2), freq) for (token1, token2), freq in items]
+
+
+def _sort_by_decreasing_count(counts: Counter, top: int = None) -> list[tuple]:
+    """Returns the items of `counts` ordered by decreasing count, with tied keys in increasing order.
+
+    Neither pass of the sort calls back into Python per comparison: the items are first sorted by their (unique)
+    keys, then stably sorted by their counts in reverse, which keeps the tied keys in increasing order.
+
+    If `top` is given, only the first `top` of those items are returned, selected by `heapq.nsmallest` in
+    O(n log `top`) time instead of sorting all of the n items.
+
+    """
+    if top is not None:
+        return heapq.nsmallest(top, counts.items(), key=_decreasing_count_key)
+
+    items = sorted(counts.items())
+    items.sort(key=itemgetter(1), reverse=True)
+    return items
+
+
+def _decreasing_count_key(item: tuple) -> tuple:
+    """Returns the key that orders a (key, count) item the same way `_sort_by_decreasing_count` does."""
+    return -item[1], item[0]
 
 
 if __name__ == '__main__':
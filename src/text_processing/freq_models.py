@@ -18,6 +18,7 @@ class Pair:
         _object2 (object): Second object stored in the `Pair`, AKA `value`.
 
     """
+    __slots__ = ("_object1", "_object2")
 
     def __init__(self, o1: object, o2: object) -> None:
         self._object1 = o1
@@ -26,26 +27,22 @@ class Pair:
     @property
     def object1(self) -> object:
         """Getter for `object1`."""
-        # TODO: implement me
-        return None
+        return self._object1
 
     @object1.setter
     def object1(self, o1: object) -> None:
         """Setter for `object1`."""
-        # TODO: implement me
-        pass
+        self._object1 = o1
 
     @property
     def object2(self) -> object:
         """Getter for `object2`."""
-        # TODO: implement me
-        return None
+        return self._object2
 
     @object2.setter
     def object2(self, o2: object) -> None:
         """Setter for `object2`."""
-        # TODO: implement me
-        pass
+        self._object2 = o2
 
     def __eq__(self, other: object) -> bool:
         """Compares `self` to `other` (object) given to return `True` if equal and `False` otherwise.
@@ -56,7 +53,10 @@ class Pair:
             other: Object to compare to `self`. May be `None`.
 
         """
-        # TODO: implement me
+        if self is other:
+            return True
+        elif other is not None and isinstance(other, Pair):
+            return self._object1 == other._object1 and self._object2 == other._object2
         return False
 
     def __str__(self) -> str:
@@ -65,8 +65,7 @@ class Pair:
         If either `key` (`object1`) or `value` (`object2`) is `None`, "None" is used in their place.
 
         """
-        # TODO: implement me
-        return ""
+        return f"<{self._object1}:{self._object2}>"
 
     def __hash__(self) -> int:
         """Returns the result of hashing both `key` and `value`.
@@ -85,28 +84,37 @@ class TwoGram(Pair):
     Attributes:
         _object1 (object): From superclass `Pair`. Represents the first token in a `TwoGram`.
         _object2 (object): From superclass `Pair`. Represents the second token in a `TwoGram`.
+        _hash (int | None): Memoized result of `__hash__`; reset to `None` whenever either token is changed.
+        _sort_key (tuple | None): Memoized result of `_key`; reset to `None` whenever either token is changed.
 
     """
+    __slots__ = ("_hash", "_sort_key")
 
     def __init__(self, token1: object, token2: object) -> None:
-        if token1 is None or token2 is None or type(token1) == type(token2):
+        if token1 is None or token2 is None or type(token1) is type(token2):
             super().__init__(token1, token2)
+            self._hash = None
+            self._sort_key = None
         else:
             raise ValueError("Two tokens must be of the same type.")
 
     @Pair.object1.setter
     def object1(self, o1) -> None:
         """Overriding setter for `object1` to enforce type symmetry."""
-        if o1 is None or type(self._object2) == type(o1):
+        if o1 is None or type(self._object2) is type(o1):
             self._object1 = o1
+            self._hash = None
+            self._sort_key = None
         else:
             raise ValueError("Two tokens must be of the same type.")
 
     @Pair.object2.setter
     def object2(self, o2) -> None:
         """Overriding setter for `object2` to enforce type symmetry."""
-        if o2 is None or type(self._object1) == type(o2):
+        if o2 is None or type(self._object1) is type(o2):
             self._object2 = o2
+            self._hash = None
+            self._sort_key = None
         else:
             raise ValueError("Two tokens must be of the same type.")
 
@@ -114,6 +122,8 @@ class TwoGram(Pair):
         """Compares `self` to `other` (object) given to return `True` if equal and `False` otherwise.
 
         Two `TwoGram`s are equal if both of their `key`s (`object1`s) and `value`s (`object2`s) are equal.
+        If both `TwoGram`s have already memoized their hashes, differing hashes settle the inequality without
+        comparing the tokens.
 
         Args:
             other: Object to compare to `self`. May be `None`.
@@ -121,34 +131,32 @@ class TwoGram(Pair):
         """
         if self is other:
             return True
-        elif other is not None and isinstance(other, TwoGram):
-            return super().__eq__(other)
+        elif type(other) is TwoGram:
+            h, other_h = self._hash, other._hash
+            if h is not None and other_h is not None and h != other_h:
+                return False
+            return self._object1 == other._object1 and self._object2 == other._object2
         return False
 
     def __ne__(self, other: object) -> bool:
         """Complement of __eq__, used to support the `!=` (not equals) operation."""
-        # TODO: implement me [HINT: use `__eq__` from above; this should be a one-liner]
-        return False
+        return not self.__eq__(other)
 
     def __lt__(self, other: object) -> bool:
         """Returns `True` if `self` < `other`, `False` otherwise."""
-        # TODO: implement me [HINT: use `_compare_token_pairs` from below; this should be a one-liner]
-        return False
+        return type(other) is TwoGram and self._key() < other._key()
 
     def __le__(self, other: object) -> bool:
         """Returns `True` if `self` <= `other`, `False` otherwise."""
-        # TODO: implement me [HINT: use `_compare_token_pairs` from below; this should be a one-liner]
-        return False
+        return type(other) is TwoGram and self._key() <= other._key()
 
     def __gt__(self, other: object) -> bool:
         """Returns `True` if `self` > `other`, `False` otherwise."""
-        # TODO: implement me [HINT: use `_compare_token_pairs` from below; this should be a one-liner]
-        return False
+        return type(other) is not TwoGram or self._key() > other._key()
 
     def __ge__(self, other: object) -> bool:
         """Returns `True` if `self` >= `other`, `False` otherwise."""
-        # TODO: implement me [HINT: use `_compare_token_pairs` from below; this should be a one-liner]
-        return False
+        return type(other) is not TwoGram or self._key() >= other._key()
 
     def __hash__(self) -> int:
         """Reuses `Pair`'s hash method.
@@ -156,9 +164,14 @@ class TwoGram(Pair):
         This needs to be called explicitly because not doing so will implicitly set
          __hash___() to None because we are implementing __eq__ but not __hash__.
 
+        The hash is computed once and memoized, since a `TwoGram` is hashed on every insertion to and lookup in
+        a `dict` or a `set` but its tokens rarely change afterwards.
+
         """
-        # TODO: implement me [HINT: just call the superclass' `__hash__`]
-        return 0
+        h = self._hash
+        if h is None:
+            h = self._hash = super().__hash__()
+        return h
 
     def _compare_token_pairs(self, other: object) -> int:
         """Java-style comparator method to make rich comparisons simpler.
@@ -166,32 +179,50 @@ class TwoGram(Pair):
         Returns -1 if self < other, 0 if self == other, and 1 if self > other.
         Types that do not match (including `NoneType`) are considered < any `TwoGram`.
 
+        The tokens are compared directly when none of them is `None`, which is by far the most common case;
+        otherwise, each pair of tokens is compared by `_compare_tokens`.
+
         """
-        if other is None or not isinstance(other, TwoGram):
+        if type(other) is not TwoGram:
             return 1
-        else:
-            first_tokens = _compare_tokens(self.object1, other.object1)
-            if first_tokens:
-                return first_tokens
-            else:
-                return _compare_tokens(self.object2, other.object2)
+
+        a1, a2, b1, b2 = self._object1, self._object2, other._object1, other._object2
+        if a1 is not None and a2 is not None and b1 is not None and b2 is not None:
+            if a1 != b1:
+                return -1 if a1 < b1 else 1
+            if a2 != b2:
+                return -1 if a2 < b2 else 1
+            return 0
+        return _compare_tokens(a1, b1) or _compare_tokens(a2, b2)
+
+    def _key(self) -> tuple:
+        """Returns the memoized sort key of `self`, which orders `TwoGram`s the same way `_compare_tokens` orders
+        their tokens, first by `object1` and then by `object2`.
+
+        Each token is wrapped in a 1-tuple, or replaced by an empty tuple if it is `None`, so that `None` comes
+        before any token and comparing two `TwoGram`s takes a single tuple comparison (done in C).
+
+        """
+        key = self._sort_key
+        if key is None:
+            o1, o2 = self._object1, self._object2
+            key = self._sort_key = (() if o1 is None else (o1,), () if o2 is None else (o2,))
+        return key
 
 
 def _compare_tokens(t1: object, t2: object) -> int:
     """Helper function to deal with `NoneTypes`.
 
     Returns -1 if t1 < t2, 0 if t1 == t2, and 1 if t1 > t2.
+    `None` is considered < any token, and == another `None`.
 
     """
-    if t1 is None and t2 is None:
-        return 0
+    if t1 is None:
+        return 0 if t2 is None else -1
+    elif t2 is None:
+        return 1
     else:
-        if t1 is None:
-            return -1
-        elif t2 is None:
-            return 1
-        else:
-            return 0 if t1 == t2 else -1 if t1 < t2 else 1
+        return 0 if t1 == t2 else -1 if t1 < t2 else 1
 
 
 class Frequency:
@@ -200,8 +231,11 @@ class Frequency:
     Attributes:
         _token (object): A word (`str`) or a `TwoGram` to associate with frequency.
         _freq (int): The number of occurrences for the associated `_token`.
+        _cmp_key (tuple | None): Memoized result of `_key`; reset to `None` whenever `_freq` is incremented.
 
     """
+    __slots__ = ("_token", "_freq", "_cmp_key")
+
     def __init__(self, token: object, freq: int = 0) -> None:
         """Fully parameterized constructor to create a populated `Frequency`.
 
@@ -214,25 +248,27 @@ class Frequency:
              ValueError: If `token` parameter is not of type `str` or `TwoGram`.
 
         """
-        # TODO: implement me [HINT: use `ValueError("A token must either be of type str or TwoGram.")`]
-        pass
+        if isinstance(token, (str, TwoGram)):
+            self._token = token
+            self._freq = freq
+            self._cmp_key = None
+        else:
+            raise ValueError("A token must either be of type str or TwoGram.")
 
     @property
     def token(self) -> object:
         """Getter for `token`."""
-        # TODO: implement me
-        return None
+        return self._token
 
     @property
     def freq(self) -> int:
         """Getter for `freq`."""
-        # TODO: implement me
-        return 0
+        return self._freq
 
     def increment_freq(self) -> None:
         """Increments the freq by 1."""
-        # TODO: implement me
-        pass
+        self._freq += 1
+        self._cmp_key = None
 
     def __eq__(self, other: object) -> bool:
         """Compares `self` to `other` (object) given to return `True` if equal and `False` otherwise.
@@ -243,38 +279,35 @@ class Frequency:
             other: Object to compare to `self`. May be `None`.
 
         """
-        # TODO: implement me.
+        if self is other:
+            return True
+        elif type(other) is Frequency:
+            return self._freq == other._freq and self._token == other._token
         return False
 
     def __ne__(self, other: object) -> bool:
         """Complement of __eq__, used to support the `!=` (not equals) operation."""
-        # TODO: implement me
-        return False
+        return not self.__eq__(other)
 
     def __lt__(self, other: object) -> bool:
         """Returns `True` if `self` < `other`, `False` otherwise."""
-        # TODO: implement me
-        return False
+        return type(other) is Frequency and self._key() < other._key()
 
     def __le__(self, other: object) -> bool:
         """Returns `True` if `self` <= `other`, `False` otherwise."""
-        # TODO: implement me
-        return False
+        return type(other) is Frequency and self._key() <= other._key()
 
     def __gt__(self, other: object) -> bool:
         """Returns `True` if `self` > `other`, `False` otherwise."""
-        # TODO: implement me
-        return False
+        return type(other) is not Frequency or self._key() > other._key()
 
     def __ge__(self, other: object) -> bool:
         """Returns `True` if `self` >= `other`, `False` otherwise."""
-        # TODO: implement me
-        return False
+        return type(other) is not Frequency or self._key() >= other._key()
 
     def __str__(self):
         """Returns the string representation of `Frequency` in this format: "token:freq"."""
-        # TODO: implement me
-        return ""
+        return f"{self._token}:{self._freq:d}"
 
     def __hash__(self) -> int:
         """Returns the result of hashing both `token` and `freq`.
@@ -282,15 +315,34 @@ class Frequency:
         In other words, any `Frequency` with the same `token` and `freq` attributes should have the same hash.
 
         """
-        # TODO: implement me [HINT: this will very similar to the `__hash__` in class `Pair`]
-        return 0
+        return hash((self._token, self._freq))
 
     def _compare_frequency(self, other: object) -> int:
         """Java-style comparator method to make rich comparisons simpler.
 
         Returns -1 if self < other, 0 if self == other, and 1 if self > other.
         Types that do not match (including `NoneType`) are considered < any `Frequency`.
+        A `Frequency` with a higher `freq` is considered < one with a lower `freq`, so that sorting a list of
+        `Frequency`s in ascending order puts the most frequent tokens first; ties are broken by the `token`s.
+
+        """
+        if type(other) is not Frequency:
+            return 1
+        else:
+            key, other_key = self._key(), other._key()
+            return 0 if key == other_key else -1 if key < other_key else 1
+
+    def _key(self) -> tuple:
+        """Returns the memoized sort key of `self`, which orders `Frequency`s the same way `_compare_frequency` does.
+
+        The key is the negated `freq` followed by the `token`: a word as-is, or a `TwoGram` by its own sort key
+        (`TwoGram._key`). A leading 0 or 1 keeps words before `TwoGram`s when both kinds of tokens are compared.
+        The key of a `TwoGram` token is taken when the key is built, so it is not expected to change afterwards.
 
         """
-        # TODO: implement me [HINT: this will be somewhat similar to TwoGram._compare_token_pairs]
-        return 0
+        key = self._cmp_key
+        if key is None:
+            token = self._token
+            token_key = (0, token) if isinstance(token, str) else (1, token._key())
+            key = self._cmp_key = (-self._freq, token_key)
+        return key
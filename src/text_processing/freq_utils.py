@@ -2,8 +2,12 @@
 """Provides utility methods `tokenize_file` and `print_frequencies` for text processing.
 """
 
+import os
 import sys
 import re
+import tempfile
+from array import array
+from hashlib import blake2b
 from io import TextIOWrapper
 from text_processing.freq_models import Frequency
 
@@ -14,6 +18,14 @@ __credits__ = ["Boaty McBoatface", "Planey McPlaneface",
 __license__ = "MIT"
 __email__ = "mryu@westmont.edu"
 
+TOKEN_PATTERN = re.compile(r"[\w']+")  # A token is a run of alphanumeric characters (and `'`).
+# Maps every ASCII byte that `TOKEN_PATTERN` does not match to a space, leaving the token characters as-is.
+ASCII_TOKEN_TABLE = bytes(c if TOKEN_PATTERN.fullmatch(chr(c)) else 0x20 for c in range(0x80)) + b" " * 0x80
+# Default directory for the tokens cached by `tokenize_file_cached`, under the user's cache directory (so that the
+# cache does not depend on, nor load files from, the current working directory).
+TOKEN_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                               "text_processing", "tokens")
+
 
 def tokenize_file(file_obj: TextIOWrapper) -> list:
     """Reads the input text file and splits it into alphanumeric tokens.
@@ -32,9 +44,104 @@ def tokenize_file(file_obj: TextIOWrapper) -> list:
         >>> fo = open("/path/to/file.txt", 'r')
         >>> tokenize_file(fo)
         ["an", "input", "string", "this", "is", "or", "isn't", "it", "123", "45"]
+
+    Notes:
+        The rest of the file is read and tokenized in one pass rather than line by line; since `TOKEN_PATTERN`
+        never matches a line break, no token spans multiple lines either way.
+    """
+    return tokenize_string(file_obj.read())
+
+
+def tokenize_file_cached(path: str, cache_dir: str = TOKEN_CACHE_DIR) -> list:
+    """Tokenizes the text file at `path` the same way `tokenize_file` does, caching the tokens in `cache_dir`.
+
+    The tokens are stored in a file named after the BLAKE2b digest of the file's contents (and of
+    `TOKEN_PATTERN`), so a file that has not changed since it was last tokenized is loaded from the cache
+    instead of being tokenized again, while a changed file (or tokenizer) simply misses the cache.
+
+    Each cache file is written to a temporary file first and then moved into place by `os.replace`, so a crash
+    or a concurrent run never leaves a partially written cache file behind; a cache file that cannot be loaded
+    anyway (see `_load_cached_tokens`) is treated as a miss and written again.
+
+    Notes:
+        A cache file is plain UTF-8 text: the number of tokens on the first line, followed by one token per line
+        (a token never contains whitespace). Unlike a pickle, loading it can never run code, so a file planted in
+        the (shared) cache directory can at worst make a run miss the cache or return the wrong tokens.
+
+    Args:
+        path (str): path to the UTF-8 encoded text file to tokenize.
+        cache_dir (str): directory to keep the cached tokens in; created if it does not exist.
+
+    Yields:
+        A list of the tokens in the file, exactly as `tokenize_file` would return them.
     """
-    # TODO: implement me [HINT: use regexr.com and re; the regex required here is quite simple!]
-    return []
+    with open(path, 'rb') as fo:
+        data = fo.read()
+
+    digest = blake2b(data, digest_size=16)
+    digest.update(TOKEN_PATTERN.pattern.encode("utf-8"))
+    cache_path = os.path.join(cache_dir, digest.hexdigest() + ".tok")
+
+    tokens = _load_cached_tokens(cache_path)
+    if tokens is not None:
+        return tokens
+
+    tokens = tokenize_string(data.decode("UTF-8"))
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=cache_dir)
+    try:
+        with os.fdopen(fd, 'w', encoding="UTF-8", newline="\n") as cache_fo:
+            cache_fo.write(f"{len(tokens):d}\n")
+            cache_fo.writelines(token + "\n" for token in tokens)
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return tokens
+
+
+def _load_cached_tokens(cache_path: str) -> list | None:
+    """Returns the tokens stored in the cache file at `cache_path` by `tokenize_file_cached`, or `None` if the file
+    does not exist, cannot be read or decoded, or its number of tokens does not match its first line (e.g., when
+    the file has been truncated)."""
+    try:
+        with open(cache_path, 'r', encoding="UTF-8", newline="\n") as cache_fo:
+            lines = cache_fo.read().split("\n")
+    except (OSError, ValueError):  # `UnicodeDecodeError` is a `ValueError`.
+        return None
+
+    if len(lines) < 2 or lines[-1] or lines[0] != str(len(lines) - 2):
+        return None
+    return list(map(sys.intern, lines[1:-1]))
+
+
+def tokenize_string(text: str) -> list:
+    """Splits the input text into alphanumeric tokens, the same way `tokenize_file` does for a text file.
+
+    Args:
+        text (str): text to tokenize.
+
+    Yields:
+        A list of these tokens, ordered according to their occurrence in the original text.
+
+    Example:
+        >>> tokenize_string("An input string, this is! (or isn't it?) 123-45")
+        ["an", "input", "string", "this", "is", "or", "isn't", "it", "123", "45"]
+
+    Notes:
+        Every token is interned (`sys.intern`), so repeated words share a single `str` object and the `dict`
+        lookups made while counting them can match by identity before comparing their characters.
+
+        ASCII-only text is not matched by the regex at all: `ASCII_TOKEN_TABLE` turns every separator into a
+        space in a single `bytes.translate` pass, and `split` then yields the exact same tokens that
+        `TOKEN_PATTERN` would have found. Any other text is matched by `TOKEN_PATTERN`.
+    """
+    text = text.lower()
+    if text.isascii():
+        tokens = text.encode("ascii").translate(ASCII_TOKEN_TABLE).decode("ascii").split()
+    else:
+        tokens = TOKEN_PATTERN.findall(text)
+    return list(map(sys.intern, tokens))
 
 
 def print_frequencies(freqs: list[Frequency], out: TextIOWrapper) -> None:
@@ -74,8 +181,30 @@ def print_frequencies(freqs: list[Frequency], out: TextIOWrapper) -> None:
              1 think you
              3 you know
     """
-    # TODO: implement me
+    total = sum(freq.freq for freq in freqs)
+    lines = [f"{total:>6d} total items\n{len(freqs):>6d} unique items\n\n"]
+    lines.extend(f"{freq.freq:>6d} {freq.token}\n" for freq in freqs)
     try:
-        pass
+        out.write("".join(lines))
     except IOError as e:  # Leave this `except` block as-is.
         print("Encountered an error while printing:", e)
+
+
+def print_frequencies_soa(tokens: list, counts: array, out: TextIOWrapper) -> None:
+    """Prints the parallel `tokens` and `counts` (e.g., as returned by `compute_word_freq_soa`) to the stream
+    passed in via the `out` argument, in the exact same format as `print_frequencies`.
+
+    The total is summed directly from the packed `counts`, and each row zips a token with its count, so no
+    `Frequency` is needed for printing.
+
+    Args:
+        tokens (list): the words (or `TwoGram`s) to print, in order.
+        counts (array): the number of occurrences of each token in `tokens`, respectively.
+        out (TextIOWrapper): output stream to print to.
+    """
+    lines = [f"{sum(counts):>6d} total items\n{len(tokens):>6d} unique items\n\n"]
+    lines.extend(f"{count:>6d} {token}\n" for token, count in zip(tokens, counts))
+    try:
+        out.write("".join(lines))
+    except IOError as e:
+        print("Encountered an error while printing:", e)